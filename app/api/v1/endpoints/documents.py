@@ -133,7 +133,12 @@ async def extract_document(
     factory = create_extractor_factory()
     extractor = factory.create(document_model.file_path)
 
-    text_enricher = TextEnricher(settings.spacy_model)
+    text_enricher = TextEnricher(
+        settings.spacy_model,
+        batch_size=settings.spacy_batch_size,
+        use_gpu=settings.spacy_use_gpu,
+        lazy_nlp=settings.nlp_lazy_mode,
+    )
     table_normalizer = TableNormalizer()
     # Créer le service OCR et l'injecter dans ImageProcessor
     ocr_service = OcrService(tesseract_cmd=settings.tesseract_cmd)
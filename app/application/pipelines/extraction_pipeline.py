@@ -116,7 +116,7 @@ class ExtractionPipeline:
             # Structurer le contenu en blocs
             # Convertir UUID en string pour compatibilité SQLite
             doc_id = str(document.id) if hasattr(document.id, '__str__') else document.id
-            content_blocks = await self.content_structurer.structure(
+            content_blocks = self.content_structurer.structure(
                 extraction_result, doc_id
             )
 
@@ -127,7 +127,7 @@ class ExtractionPipeline:
                 "file_size": document.file_metadata.file_size,
             }
 
-            structured_data = await self.document_structurer.structure(
+            structured_data = self.document_structurer.structure(
                 content_blocks, doc_id, metadata
             )
 
@@ -22,6 +22,10 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     debug: bool = False
     log_level: str = "INFO"
+    verify_deps_on_startup: bool = Field(
+        default=True,
+        description="Vérifier/installer les dépendances au démarrage (désactiver en production)",
+    )
 
     # Base de données
     database_url: str = Field(
@@ -29,6 +33,10 @@ class Settings(BaseSettings):
         description="URL de connexion à la base de données",
     )
     database_echo: bool = False
+    database_pool_size: int = Field(
+        default=5,
+        description="Connexions ouvertes à l'avance et gardées dans le pool",
+    )
 
     # Stockage fichiers
     upload_dir: Path = Field(default=Path("./uploads"), description="Répertoire d'upload")
@@ -42,12 +50,32 @@ class Settings(BaseSettings):
         default="fr_core_news_md",
         description="Modèle SpaCy à utiliser (version 3.8.0 installée)",
     )
+    spacy_batch_size: int = Field(
+        default=32,
+        description="Taille des lots de textes passés à nlp.pipe()",
+    )
+    spacy_use_gpu: bool = Field(
+        default=False,
+        description="Exécuter SpaCy sur GPU si disponible (modèles transformer)",
+    )
+    nlp_lazy_mode: bool = Field(
+        default=False,
+        description="Extraire les entités par regex sans charger SpaCy à l'ingestion",
+    )
 
     # Tesseract
     tesseract_cmd: Optional[str] = Field(
         default=None,
         description="Chemin vers l'exécutable Tesseract (auto-détecté si None)",
     )
+    tesseract_psm: int = Field(
+        default=6,
+        description="Mode de segmentation Tesseract (6 = bloc uniforme, 3 = multi-colonnes)",
+    )
+    tesseract_warm_up: bool = Field(
+        default=False,
+        description="Préchauffer Tesseract au démarrage (modèles de langue en cache)",
+    )
 
     # API
     api_prefix: str = "/api/v1"
@@ -120,13 +120,13 @@ class DependenciesChecker:
             import spacy
 
             model_name = "fr_core_news_md"
-            try:
-                nlp = spacy.load(model_name)
+            # Vérifier que le paquet du modèle est installé sans le charger : le
+            # modèle n'est chargé qu'une fois, par TextEnricher (préchargement)
+            if spacy.util.is_package(model_name):
                 self.logger.info(f"Modèle SpaCy '{model_name}' trouvé")
                 return True
-            except OSError:
-                self.logger.warning(f"Modèle SpaCy '{model_name}' non trouvé")
-                return False
+            self.logger.warning(f"Modèle SpaCy '{model_name}' non trouvé")
+            return False
 
         except ImportError:
             self.logger.warning("SpaCy n'est pas installé")
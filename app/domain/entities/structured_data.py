@@ -19,7 +19,14 @@ class StructuredData(BaseModel):
 
     def to_json(self) -> str:
         """Convertir en JSON."""
-        import json
+        try:
+            import orjson
+        except ImportError:  # orjson optionnel : repli sur json
+            import json
 
-        return json.dumps(self.data, ensure_ascii=False, indent=2)
+            return json.dumps(self.data, ensure_ascii=False, indent=2)
+
+        return orjson.dumps(
+            self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
 
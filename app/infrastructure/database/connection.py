@@ -1,17 +1,38 @@
 """Configuration de la connexion à la base de données."""
 
+import asyncio
+from typing import Any
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
 from app.config import get_settings
 
+try:
+    import orjson
+except ImportError:  # orjson optionnel : sérialisation JSON par défaut (json)
+    orjson = None
+
 settings = get_settings()
 
+
+def _orjson_dumps(value: Any) -> str:
+    """Sérialiser une colonne JSON (structured_data, métadonnées) avec orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Taille du pool : SQLite garde le pool par défaut de SQLAlchemy
+_pool_options: dict[str, Any] = {}
+if not settings.database_url.startswith("sqlite"):
+    _pool_options["pool_size"] = settings.database_pool_size
+
 # Créer le moteur async
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
     future=True,
+    **_pool_options,
+    **({"json_serializer": _orjson_dumps} if orjson is not None else {}),
 )
 
 # Session factory
@@ -36,10 +57,49 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+def _load_models() -> None:
+    """Importer les modèles pour les enregistrer dans Base.metadata."""
+    import app.infrastructure.database.models  # noqa: F401
+
+
 async def init_db() -> None:
     """Initialiser la base de données (créer les tables)."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Import des modèles (synchrone) dans un thread, pendant l'ouverture de la connexion
+    models_loaded = asyncio.create_task(asyncio.to_thread(_load_models))
+    try:
+        async with engine.begin() as conn:
+            await models_loaded
+            await conn.run_sync(Base.metadata.create_all)
+    finally:
+        # Ne pas laisser la tâche orpheline si la connexion échoue
+        if not models_loaded.done():
+            models_loaded.cancel()
+
+
+async def warm_up_pool(size: int | None = None) -> None:
+    """
+    Ouvrir à l'avance les connexions du pool (connexion et authentification).
+
+    Les connexions sont rendues au pool aussitôt : les premières requêtes les
+    réutilisent au lieu d'en établir de nouvelles.
+
+    Args:
+        size: Nombre de connexions à ouvrir (database_pool_size par défaut)
+    """
+    size = size or settings.database_pool_size
+    connections = await asyncio.gather(
+        *(engine.connect() for _ in range(size)), return_exceptions=True
+    )
+    await asyncio.gather(
+        *(
+            connection.close()
+            for connection in connections
+            if not isinstance(connection, BaseException)
+        )
+    )
+    for connection in connections:
+        if isinstance(connection, BaseException):
+            raise connection
 
 
 async def close_db() -> None:
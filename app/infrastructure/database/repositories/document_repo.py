@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.document import DocumentStatus
@@ -31,3 +31,38 @@ class DocumentRepository(BaseRepository[DocumentModel]):
         )
         return list(result.scalars().all())
 
+    async def update_status(
+        self,
+        doc_ids: list[UUID | str],
+        status: DocumentStatus | str,
+        error_message: str | None = None,
+    ) -> int:
+        """
+        Mettre à jour le statut de plusieurs documents en un seul UPDATE.
+
+        Args:
+            doc_ids: IDs des documents à mettre à jour
+            status: Nouveau statut
+            error_message: Message d'erreur à enregistrer (statut en échec)
+
+        Returns:
+            Nombre de documents mis à jour
+        """
+        if not doc_ids:
+            return 0
+
+        # Convertir UUID en string pour compatibilité SQLite
+        ids = [str(doc_id) if isinstance(doc_id, UUID) else doc_id for doc_id in doc_ids]
+        values: dict[str, str] = {
+            "status": status.value if isinstance(status, DocumentStatus) else status
+        }
+        if error_message is not None:
+            values["error_message"] = error_message
+
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.id.in_(ids))
+            .values(**values)
+        )
+        await self.session.commit()
+        return result.rowcount
@@ -20,7 +20,7 @@ def create_extractor_factory() -> ExtractorFactory:
     factory.register(PdfExtractor())
     factory.register(ExcelExtractor())
     factory.register(WordExtractor())
-    factory.register(OcrExtractor(tesseract_cmd=settings.tesseract_cmd))
+    factory.register(OcrExtractor(tesseract_cmd=settings.tesseract_cmd, psm=settings.tesseract_psm))
 
     logger.info("Factory d'extracteurs initialisée")
     return factory
@@ -4,6 +4,7 @@ import asyncio
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pytesseract
 from PIL import Image, ImageEnhance, ImageFilter
 
@@ -12,14 +13,29 @@ from app.core.logging import get_logger
 from app.domain.value_objects.content_metadata import ContentMetadata
 from app.domain.value_objects.extraction_result import ExtractionResult, ImageBlock, TextBlock
 from app.infrastructure.extractors.base import BaseExtractor
+from app.infrastructure.services.ocr_service import average_confidence
+
+# Au-delà de cet écart-type, l'image est déjà suffisamment contrastée pour l'OCR
+HIGH_CONTRAST_STD = 70.0
 
 
 class OcrExtractor(BaseExtractor):
     """Extracteur d'images avec Tesseract OCR et preprocessing."""
 
-    def __init__(self, tesseract_cmd: str | None = None, logger: Any = None) -> None:
-        """Initialiser l'extracteur."""
+    def __init__(
+        self, tesseract_cmd: str | None = None, psm: int = 6, logger: Any = None
+    ) -> None:
+        """
+        Initialiser l'extracteur.
+
+        Args:
+            tesseract_cmd: Chemin vers l'exécutable Tesseract (optionnel)
+            psm: Mode de segmentation Tesseract (6 = bloc uniforme, évite l'analyse de layout)
+            logger: Logger à utiliser (optionnel)
+        """
         super().__init__(logger or get_logger(__name__))
+        # OEM 1 = moteur LSTM seul, plus rapide que legacy+LSTM
+        self._ocr_config = f"--psm {psm} --oem 1"
         
         # Si un chemin est fourni, l'utiliser
         if tesseract_cmd:
@@ -36,7 +52,7 @@ class OcrExtractor(BaseExtractor):
         self._validate_file(file_path)
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(None, self._extract_sync, file_path)
             return result
         except Exception as e:
@@ -51,16 +67,21 @@ class OcrExtractor(BaseExtractor):
 
         # Extraire le texte avec OCR
         try:
-            ocr_text = pytesseract.image_to_string(processed_image, lang="fra+eng")
-            ocr_data = pytesseract.image_to_data(processed_image, output_type=pytesseract.Output.DICT)
+            ocr_text = pytesseract.image_to_string(
+                processed_image, lang="fra+eng", config=self._ocr_config
+            )
+            ocr_data = pytesseract.image_to_data(
+                processed_image, output_type=pytesseract.Output.DICT, config=self._ocr_config
+            )
         except Exception as e:
             self.logger.warning(f"Erreur OCR: {e}, tentative sans preprocessing")
-            ocr_text = pytesseract.image_to_string(image, lang="fra+eng")
-            ocr_data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+            ocr_text = pytesseract.image_to_string(image, lang="fra+eng", config=self._ocr_config)
+            ocr_data = pytesseract.image_to_data(
+                image, output_type=pytesseract.Output.DICT, config=self._ocr_config
+            )
 
         # Calculer la confiance moyenne
-        confidences = [int(conf) for conf in ocr_data.get("conf", []) if conf != "-1"]
-        avg_confidence = sum(confidences) / len(confidences) / 100.0 if confidences else 0.0
+        avg_confidence = average_confidence(ocr_data.get("conf", []))
 
         # Créer les blocs
         text_blocks: list[TextBlock] = []
@@ -104,6 +125,11 @@ class OcrExtractor(BaseExtractor):
         if image.mode != "L":
             image = image.convert("L")
 
+        # Image déjà binaire / bien contrastée : le preprocessing la dégraderait
+        arr = np.asarray(image)
+        if arr.std() > HIGH_CONTRAST_STD and 50 <= arr.mean() <= 200:
+            return image
+
         # Améliorer le contraste
         enhancer = ImageEnhance.Contrast(image)
         image = enhancer.enhance(2.0)
@@ -24,7 +24,7 @@ class ExcelExtractor(BaseExtractor):
         self._validate_file(file_path)
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(None, self._extract_sync, file_path)
             return result
         except Exception as e:
@@ -62,12 +62,17 @@ class ExcelExtractor(BaseExtractor):
                         for row in (rows[1:] if len(rows) > 1 else [])
                     ]
 
-                    metadata = ContentMetadata(
+                    # Headers et rows sont déjà nettoyés : pas de revalidation
+                    metadata = ContentMetadata.model_construct(
                         order=len(tables),
                         extraction_method="openpyxl",
                         additional_metadata={"sheet_name": sheet_name},
                     )
-                    tables.append(TableBlock(headers=headers, rows=data_rows, metadata=metadata))
+                    tables.append(
+                        TableBlock.model_construct(
+                            headers=headers, rows=data_rows, metadata=metadata
+                        )
+                    )
 
         finally:
             workbook.close()
@@ -24,7 +24,7 @@ class WordExtractor(BaseExtractor):
         self._validate_file(file_path)
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(None, self._extract_sync, file_path)
             return result
         except Exception as e:
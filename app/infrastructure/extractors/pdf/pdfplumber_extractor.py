@@ -30,7 +30,7 @@ class PdfPlumberExtractor(BaseExtractor):
 
         try:
             # Exécuter dans un thread pool car pdfplumber est synchrone
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(None, self._extract_sync, file_path)
             return result
         except Exception as e:
@@ -90,13 +90,16 @@ class PdfPlumberExtractor(BaseExtractor):
                                         cleaned_row.append("")
                             rows.append(cleaned_row)
                         
-                        metadata = ContentMetadata(
+                        # Headers et rows sont déjà nettoyés : pas de revalidation
+                        metadata = ContentMetadata.model_construct(
                             page_number=page_num,
                             order=len(tables),
                             extraction_method="pdfplumber",
                         )
                         tables.append(
-                            TableBlock(headers=headers, rows=rows, metadata=metadata)
+                            TableBlock.model_construct(
+                                headers=headers, rows=rows, metadata=metadata
+                            )
                         )
 
         return ExtractionResult(text_blocks=text_blocks, tables=tables)
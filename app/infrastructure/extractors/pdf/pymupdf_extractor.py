@@ -16,6 +16,10 @@ from app.domain.value_objects.extraction_result import (
 )
 from app.infrastructure.extractors.base import BaseExtractor
 
+# Flags pour get_text("dict") : sans TEXT_PRESERVE_IMAGES, les images ne sont pas
+# décodées dans la structure (_extract_structure n'utilise que les spans de texte)
+TEXT_DICT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_PRESERVE_LIGATURES
+
 
 class PyMuPdfExtractor(BaseExtractor):
     """Extracteur PDF avec PyMuPDF (bon pour structure et images)."""
@@ -29,7 +33,7 @@ class PyMuPdfExtractor(BaseExtractor):
         self._validate_file(file_path)
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(None, self._extract_sync, file_path)
             return result
         except Exception as e:
@@ -50,7 +54,7 @@ class PyMuPdfExtractor(BaseExtractor):
                 page = doc[page_num]
 
                 # Extraire le texte avec structure
-                text_dict = page.get_text("dict")
+                text_dict = page.get_text("dict", flags=TEXT_DICT_FLAGS)
                 page_text = page.get_text()
 
                 if page_text and page_text.strip():
@@ -1,5 +1,6 @@
 """Processeur d'images."""
 
+import asyncio
 from pathlib import Path
 from typing import Any, Optional
 
@@ -11,6 +12,11 @@ from app.domain.value_objects.extraction_result import ImageBlock, TextBlock
 from app.infrastructure.processors.base import BaseProcessor
 from app.infrastructure.services.ocr_service import OcrService
 
+# Un diagramme compte moins de 50 couleurs distinctes
+_MAX_DIAGRAM_COLORS = 49
+# Pas de sous-échantillonnage pour le rejet rapide des photos
+_SAMPLE_STEP = 4
+
 
 class ImageProcessor(BaseProcessor):
     """Processeur d'images pour extraction de métadonnées, détection de type et OCR."""
@@ -29,19 +35,22 @@ class ImageProcessor(BaseProcessor):
         self.ocr_service = ocr_service
 
     async def process(
-        self, image_block: ImageBlock
+        self, image_block: ImageBlock, ocr_available: Optional[bool] = None
     ) -> tuple[ImageBlock, Optional[TextBlock]]:
         """
         Traiter une image pour extraire métadonnées, détecter le type et appliquer OCR.
 
         Args:
             image_block: Bloc d'image à traiter
+            ocr_available: Disponibilité de l'OCR déjà vérifiée (vérifiée ici si None)
 
         Returns:
             Tuple contenant le bloc d'image enrichi et un TextBlock optionnel créé depuis l'OCR
         """
         try:
-            processed_image, text_block = await self._process_async(image_block)
+            processed_image, text_block = await self._process_async(
+                image_block, ocr_available
+            )
             return processed_image, text_block
         except Exception as e:
             self.logger.warning(f"Erreur lors du traitement d'image: {e}")
@@ -51,7 +60,7 @@ class ImageProcessor(BaseProcessor):
             )  # Retourner l'image non traitée en cas d'erreur
 
     async def _process_async(
-        self, image_block: ImageBlock
+        self, image_block: ImageBlock, ocr_available: Optional[bool] = None
     ) -> tuple[ImageBlock, Optional[TextBlock]]:
         """Traitement asynchrone avec OCR."""
         # Charger l'image
@@ -76,7 +85,7 @@ class ImageProcessor(BaseProcessor):
         }
 
         # Détecter le type de contenu
-        content_type = self._detect_content_type(image)
+        content_type = await asyncio.to_thread(self._detect_content_type, image)
 
         # Appliquer OCR si disponible
         ocr_text: Optional[str] = None
@@ -85,10 +94,11 @@ class ImageProcessor(BaseProcessor):
 
         if self.ocr_service and image_block.image_data:
             try:
-                if await self.ocr_service.is_available():
-                    ocr_text, ocr_confidence = await self.ocr_service.extract_text(
-                        image_block.image_data
-                    )
+                if ocr_available is None:
+                    ocr_available = await self.ocr_service.is_available()
+                if ocr_available:
+                    # Image déjà décodée ci-dessus : ne pas redécoder ses octets
+                    ocr_text, ocr_confidence = await self.ocr_service.extract_text_pil(image)
 
                     # Créer un TextBlock si du texte significatif a été extrait
                     if ocr_text and ocr_text.strip():
@@ -98,13 +108,13 @@ class ImageProcessor(BaseProcessor):
                             order=image_block.metadata.order,
                             extraction_method="tesseract_ocr",
                             confidence=ocr_confidence,
-                            additional_metadata={
-                                **image_block.metadata.additional_metadata,
-                                "source": "image_ocr",
-                                "image_width": image.width,
-                                "image_height": image.height,
-                                "image_format": image.format,
-                            },
+                            additional_metadata=dict(
+                                image_block.metadata.additional_metadata,
+                                source="image_ocr",
+                                image_width=image.width,
+                                image_height=image.height,
+                                image_format=image.format,
+                            ),
                         )
                         text_block = TextBlock(
                             content=ocr_text.strip(), metadata=ocr_metadata
@@ -154,8 +164,17 @@ class ImageProcessor(BaseProcessor):
         if 0.8 < aspect_ratio < 1.2:
             # Vérifier la complexité (nombre de couleurs uniques)
             if image.mode == "RGB":
-                colors = image.getcolors(maxcolors=256)
-                if colors and len(colors) < 50:
+                # Rejet rapide sur un sous-échantillon au plus proche voisin : ses couleurs
+                # sont un sous-ensemble de celles de l'image, 50 couleurs ou plus y suffisent
+                if width >= 4 * _SAMPLE_STEP and height >= 4 * _SAMPLE_STEP:
+                    sample = image.resize(
+                        (width // _SAMPLE_STEP, height // _SAMPLE_STEP),
+                        Image.Resampling.NEAREST,
+                    )
+                    if sample.getcolors(maxcolors=_MAX_DIAGRAM_COLORS) is None:
+                        return "image"
+                # getcolors retourne None au-delà de maxcolors couleurs
+                if image.getcolors(maxcolors=_MAX_DIAGRAM_COLORS):
                     return "diagramme"
 
         # Par défaut, considérer comme photo ou image générale
@@ -170,14 +189,20 @@ class ImageProcessor(BaseProcessor):
         Returns:
             Tuple contenant la liste des images traitées et la liste des TextBlocks créés depuis l'OCR
         """
-        processed_images: list[ImageBlock] = []
-        ocr_text_blocks: list[TextBlock] = []
-
-        for block in image_blocks:
-            processed_image, text_block = await self.process(block)
-            processed_images.append(processed_image)
-            if text_block:
-                ocr_text_blocks.append(text_block)
+        # Vérifier la disponibilité de l'OCR une seule fois pour tout le lot
+        ocr_available = False
+        if self.ocr_service:
+            try:
+                ocr_available = await self.ocr_service.is_available()
+            except Exception as e:
+                self.logger.warning(f"Erreur lors de la vérification de l'OCR: {e}")
+
+        results = await asyncio.gather(
+            *(self.process(block, ocr_available) for block in image_blocks)
+        )
+
+        processed_images = [processed_image for processed_image, _ in results]
+        ocr_text_blocks = [text_block for _, text_block in results if text_block]
 
         return processed_images, ocr_text_blocks
 
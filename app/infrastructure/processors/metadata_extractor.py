@@ -1,11 +1,14 @@
 """Extracteur de métadonnées."""
 
+import os
 from pathlib import Path
 from typing import Any
 
 from app.core.logging import get_logger
 from app.infrastructure.processors.base import BaseProcessor
 
+_NO_ENTITIES: tuple = ()
+
 
 class MetadataExtractor(BaseProcessor):
     """Extracteur de métadonnées de fichiers et de contenu."""
@@ -24,11 +27,13 @@ class MetadataExtractor(BaseProcessor):
         Returns:
             Dictionnaire de métadonnées
         """
-        path = Path(file_path)
-        if not path.exists():
+        # Un seul appel stat() : l'absence du fichier est détectée par l'exception
+        try:
+            stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
             return {}
 
-        stat = path.stat()
+        path = Path(file_path)
         metadata = {
             "filename": path.name,
             "file_size": stat.st_size,
@@ -51,20 +56,19 @@ class MetadataExtractor(BaseProcessor):
         Returns:
             Dictionnaire de métadonnées de contenu
         """
+        text_blocks = extraction_result.text_blocks
         metadata = {
-            "text_block_count": len(extraction_result.text_blocks),
+            "text_block_count": len(text_blocks),
             "table_count": len(extraction_result.tables),
             "image_count": len(extraction_result.images),
             "has_content": extraction_result.has_content(),
         }
 
         # Compter les entités si disponibles
-        total_entities = 0
-        for block in extraction_result.text_blocks:
-            entities = block.metadata.additional_metadata.get("entities", [])
-            total_entities += len(entities)
-
-        metadata["total_entities"] = total_entities
+        metadata["total_entities"] = sum(
+            len(block.metadata.additional_metadata.get("entities", _NO_ENTITIES))
+            for block in text_blocks
+        )
 
         return metadata
 
@@ -1,13 +1,74 @@
 """Normaliseur de tableaux."""
 
-from datetime import datetime
-from typing import Any
+import re
+from calendar import monthrange
+from datetime import MINYEAR
+from typing import Any, Callable, Sequence
 
 from app.core.exceptions import ProcessingError
 from app.core.logging import get_logger
 from app.domain.value_objects.extraction_result import TableBlock
 from app.infrastructure.processors.base import BaseProcessor
 
+_TRUE_VALUES = frozenset(("true", "oui", "yes", "1"))
+_FALSE_VALUES = frozenset(("false", "non", "no", "0"))
+_BOOLEAN_VALUES = _TRUE_VALUES | _FALSE_VALUES
+
+# Équivalents des formats strptime "%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d" :
+# même séparateur des deux côtés du mois, jour validé ensuite contre le calendrier
+_MONTH = r"1[0-2]|0[1-9]|[1-9]"
+_DAY = r"3[01]|[12]\d|0[1-9]|[1-9]| [1-9]"  # %d tolère un espace initial
+_DATE_RE = re.compile(
+    rf"(?:(?P<y1>\d{{4}})(?P<s1>[-/])(?P<m1>{_MONTH})(?P=s1)(?P<d1>{_DAY})"
+    rf"|(?P<d2>{_DAY})(?P<s2>[-/])(?P<m2>{_MONTH})(?P=s2)(?P<y2>\d{{4}}))\Z"
+)
+# Normalisation des nombres en une passe : virgule décimale -> point, espaces retirés
+_NUMBER_TABLE = str.maketrans({",": ".", " ": None})
+_DIGIT_RE = re.compile(r"\d")
+_SPECIAL_FLOAT_RE = re.compile(r"[+-]?(?:inf|infinity|nan)\Z", re.IGNORECASE)
+
+
+def _is_empty(cell: Any) -> bool:
+    """Vérifier si une cellule est vide."""
+    return cell is None or (isinstance(cell, str) and not cell.strip())
+
+
+def _convert_number(cell: Any) -> Any:
+    """Convertir une cellule d'une colonne numérique."""
+    if _is_empty(cell):
+        return None
+    try:
+        return float(str(cell).translate(_NUMBER_TABLE))
+    except ValueError:
+        return cell
+
+
+def _convert_boolean(cell: Any) -> Any:
+    """Convertir une cellule d'une colonne booléenne."""
+    if _is_empty(cell):
+        return None
+    val = str(cell).lower()
+    if val in _TRUE_VALUES:
+        return True
+    if val in _FALSE_VALUES:
+        return False
+    return cell
+
+
+def _convert_text(cell: Any) -> Any:
+    """Convertir une cellule d'une colonne texte (ou date, convertie plus tard si nécessaire)."""
+    if _is_empty(cell):
+        return None
+    return str(cell)
+
+
+_CONVERTERS = {
+    "number": _convert_number,
+    "boolean": _convert_boolean,
+    "date": _convert_text,
+    "text": _convert_text,
+}
+
 
 class TableNormalizer(BaseProcessor):
     """Normaliseur de tableaux avec détection automatique d'en-têtes et typage."""
@@ -38,11 +99,11 @@ class TableNormalizer(BaseProcessor):
         # Détecter les en-têtes
         headers = self._detect_headers(table_block)
 
-        # Nettoyer les données
-        cleaned_rows = self._clean_rows(table_block.rows)
+        # Nettoyer les données et collecter les valeurs de chaque colonne (une passe)
+        cleaned_rows, column_values = self._clean_rows(table_block.rows)
 
         # Typer les colonnes
-        column_types = self._detect_column_types(headers, cleaned_rows)
+        column_types = self._detect_column_types(headers, cleaned_rows, column_values)
 
         # Valider la cohérence
         validated_rows = self._validate_rows(cleaned_rows, column_types)
@@ -101,126 +162,130 @@ class TableNormalizer(BaseProcessor):
             return ""
         return str(cell).strip()
 
-    def _clean_rows(self, rows: list[list[Any]]) -> list[list[Any]]:
-        """Nettoyer les lignes du tableau."""
-        cleaned = []
+    def _clean_rows(
+        self, rows: list[list[Any]]
+    ) -> tuple[list[list[Any]], list[list[str]]]:
+        """
+        Nettoyer les lignes du tableau.
+
+        Returns:
+            Tuple (lignes nettoyées non vides, valeurs non vides de chaque colonne)
+        """
+        cleaned: list[list[Any]] = []
+        column_values: list[list[str]] = []
         for row in rows:
-            cleaned_row = [self._clean_cell(cell) for cell in row]
+            cleaned_row = ["" if cell is None else str(cell).strip() for cell in row]
             # Ignorer les lignes complètement vides
-            if any(cell for cell in cleaned_row):
-                cleaned.append(cleaned_row)
-        return cleaned
+            if not any(cleaned_row):
+                continue
+            cleaned.append(cleaned_row)
+            if len(cleaned_row) > len(column_values):
+                column_values.extend([] for _ in range(len(cleaned_row) - len(column_values)))
+            for values, cell in zip(column_values, cleaned_row):
+                if cell:
+                    values.append(cell)
+        return cleaned, column_values
 
     def _detect_column_types(
-        self, headers: list[str], rows: list[list[Any]]
+        self,
+        headers: list[str],
+        rows: list[list[Any]],
+        column_values: list[list[str]],
     ) -> list[str]:
-        """Détecter le type de chaque colonne."""
+        """Détecter le type de chaque colonne depuis ses valeurs non vides."""
         if not rows:
             return ["text"] * len(headers)
 
-        column_types: list[str] = []
-        num_cols = len(headers) if headers else (len(rows[0]) if rows else 0)
-
-        for col_idx in range(num_cols):
-            col_values = [row[col_idx] if col_idx < len(row) else None for row in rows]
-
-            # Analyser les valeurs de la colonne
-            type_ = self._infer_type(col_values)
-            column_types.append(type_)
-
-        return column_types
+        num_cols = len(headers) if headers else len(rows[0])
+        return [
+            self._infer_type(column_values[col_idx]) if col_idx < len(column_values) else "text"
+            for col_idx in range(num_cols)
+        ]
 
-    def _infer_type(self, values: list[Any]) -> str:
+    def _infer_type(self, values: Sequence[Any]) -> str:
         """Inférer le type d'une colonne depuis ses valeurs."""
         if not values:
             return "text"
 
-        non_empty = [v for v in values if v is not None and str(v).strip()]
+        non_empty = [str(v) for v in values if v is not None and str(v).strip()]
 
         if not non_empty:
             return "text"
 
-        # Vérifier si ce sont des dates
-        date_count = sum(1 for v in non_empty if self._is_date(str(v)))
-        if date_count > len(non_empty) * 0.7:
-            return "date"
+        # Premier type reconnu sur plus de 70% des valeurs : dates, nombres, booléens
+        threshold = len(non_empty) * 0.7
+        for type_, predicate in (
+            ("date", self._is_date),
+            ("number", self._is_number),
+            ("boolean", self._is_boolean),
+        ):
+            if self._count_exceeds(non_empty, predicate, threshold):
+                return type_
 
-        # Vérifier si ce sont des nombres
-        number_count = sum(1 for v in non_empty if self._is_number(str(v)))
-        if number_count > len(non_empty) * 0.7:
-            return "number"
+        return "text"
 
-        # Vérifier si ce sont des booléens
-        bool_count = sum(1 for v in non_empty if self._is_boolean(str(v)))
-        if bool_count > len(non_empty) * 0.7:
-            return "boolean"
+    @staticmethod
+    def _count_exceeds(
+        values: list[str], predicate: Callable[[str], bool], threshold: float
+    ) -> bool:
+        """
+        Vérifier si plus de `threshold` valeurs satisfont `predicate`.
 
-        return "text"
+        S'arrête dès que le seuil est dépassé ou ne peut plus l'être avec les
+        valeurs restantes.
+        """
+        count = 0
+        remaining = len(values)
+        for value in values:
+            remaining -= 1
+            if predicate(value):
+                count += 1
+                if count > threshold:
+                    return True
+            elif count + remaining <= threshold:
+                return False
+        return False
 
     def _is_date(self, value: str) -> bool:
         """Vérifier si une valeur ressemble à une date."""
-        # Formats de date communs
-        date_formats = ["%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d"]
-        for fmt in date_formats:
-            try:
-                datetime.strptime(value, fmt)
-                return True
-            except ValueError:
-                continue
-        return False
+        # Formats acceptés : AAAA-MM-JJ, JJ/MM/AAAA, JJ-MM-AAAA, AAAA/MM/JJ
+        match = _DATE_RE.match(value)
+        if not match:
+            return False
+        if match.group("y1"):
+            year, month, day = match.group("y1", "m1", "d1")
+        else:
+            year, month, day = match.group("y2", "m2", "d2")
+        year_int = int(year)
+        return year_int >= MINYEAR and int(day) <= monthrange(year_int, int(month))[1]
 
     def _is_number(self, value: str) -> bool:
         """Vérifier si une valeur est un nombre."""
+        # Rejet sans exception des valeurs textuelles (les plus fréquentes) :
+        # sans chiffre, float() n'accepte que inf/infinity/nan
+        if not _DIGIT_RE.search(value):
+            return bool(_SPECIAL_FLOAT_RE.match(value.translate(_NUMBER_TABLE).strip()))
         try:
-            float(value.replace(",", ".").replace(" ", ""))
+            float(value.translate(_NUMBER_TABLE))
             return True
         except ValueError:
             return False
 
     def _is_boolean(self, value: str) -> bool:
         """Vérifier si une valeur est un booléen."""
-        return value.lower() in ["true", "false", "oui", "non", "yes", "no", "1", "0"]
+        return value.lower() in _BOOLEAN_VALUES
 
     def _validate_rows(
         self, rows: list[list[Any]], column_types: list[str]
     ) -> list[list[Any]]:
         """Valider et convertir les lignes selon les types."""
-        validated = []
-        for row in rows:
-            validated_row = []
-            for i, cell in enumerate(row):
-                if i < len(column_types):
-                    validated_cell = self._convert_cell(cell, column_types[i])
-                    validated_row.append(validated_cell)
-                else:
-                    validated_row.append(cell)
-            validated.append(validated_row)
-        return validated
-
-    def _convert_cell(self, cell: Any, target_type: str) -> Any:
-        """Convertir une cellule selon le type cible."""
-        if cell is None or (isinstance(cell, str) and not cell.strip()):
-            return None
-
-        if target_type == "number":
-            try:
-                return float(str(cell).replace(",", ".").replace(" ", ""))
-            except ValueError:
-                return cell
-
-        if target_type == "boolean":
-            val = str(cell).lower()
-            if val in ["true", "oui", "yes", "1"]:
-                return True
-            if val in ["false", "non", "no", "0"]:
-                return False
-            return cell
-
-        if target_type == "date":
-            # La conversion de date sera faite plus tard si nécessaire
-            return str(cell)
-
-        return str(cell)
+        # Un convertisseur par colonne : pas de test du type cible à chaque cellule
+        converters = [_CONVERTERS.get(type_, _convert_text) for type_ in column_types]
+        num_converters = len(converters)
+        return [
+            [convert(cell) for convert, cell in zip(converters, row)] + row[num_converters:]
+            for row in rows
+        ]
 
     async def normalize_batch(self, table_blocks: list[TableBlock]) -> list[TableBlock]:
         """Normaliser plusieurs tableaux."""
@@ -1,10 +1,14 @@
 """Enrichisseur de texte avec SpaCy."""
 
 import asyncio
-from typing import Any
+import re
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar, Iterable
 
 import spacy
 from spacy import Language
+from spacy.attrs import IS_LOWER
 from spacy.lang.fr import French
 
 from app.core.exceptions import EnrichmentError
@@ -12,19 +16,101 @@ from app.core.logging import get_logger
 from app.domain.value_objects.extraction_result import TextBlock
 from app.infrastructure.processors.base import BaseProcessor
 
+# Composants SpaCy dont les annotations ne sont pas utilisées par l'enrichissement
+UNUSED_COMPONENTS = ("parser", "tagger", "morphologizer", "attribute_ruler", "lemmatizer")
+
+# Mode lazy : entités reconnues par expressions régulières (label, motif, confiance)
+_MONTHS_FR = (
+    "janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre"
+)
+_REGEX_ENTITY_PATTERNS = (
+    ("EMAIL", re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+"), 1.0),
+    (
+        "DATE",
+        re.compile(
+            rf"\b(?:\d{{1,2}}[/.-]\d{{1,2}}[/.-]\d{{2,4}}|\d{{4}}-\d{{2}}-\d{{2}}"
+            rf"|\d{{1,2}}(?:er)?\s+(?:{_MONTHS_FR})\s+\d{{4}})\b",
+            re.IGNORECASE,
+        ),
+        1.0,
+    ),
+    (
+        "MONEY",
+        re.compile(
+            r"(?:[€$£]\s?\d+(?:[\s.,]\d+)*"
+            r"|\b\d+(?:[\s.,]\d+)*\s?(?:€|\$|£|EUR|USD|euros?))(?!\w)",
+            re.IGNORECASE,
+        ),
+        1.0,
+    ),
+    # Heuristique : mots capitalisés suivis d'une forme juridique
+    (
+        "ORG",
+        re.compile(
+            r"\b(?:[A-Z][\w&'-]*\s+){1,4}(?:SA|SAS|SASU|SARL|EURL|SCI|Inc|Ltd|GmbH)\b"
+        ),
+        0.5,
+    ),
+)
+# Phrase : texte jusqu'à une ponctuation finale suivie d'un espace (ou la fin du texte)
+_SENTENCE_RE = re.compile(r"\S.*?(?:[.!?]+(?=\s|$)|$)", re.DOTALL)
+
 
 class TextEnricher(BaseProcessor):
     """Enrichisseur de texte avec NLP avancé (SpaCy)."""
 
-    def __init__(self, model_name: str = "fr_core_news_md", logger: Any = None) -> None:
-        """Initialiser l'enrichisseur."""
+    # Modèles chargés, partagés entre instances (clé : modèle, composants désactivés, GPU)
+    _MODEL_CACHE: ClassVar[dict[tuple[str, tuple[str, ...], bool], Language]] = {}
+    # Exécuteur partagé et borné : les noyaux numériques de SpaCy sont déjà
+    # multithreadés, des appels concurrents ne feraient que se disputer les cœurs
+    _EXECUTOR: ClassVar[ThreadPoolExecutor] = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="spacy"
+    )
+
+    def __init__(
+        self,
+        model_name: str = "fr_core_news_md",
+        batch_size: int = 32,
+        disable_components: Iterable[str] = UNUSED_COMPONENTS,
+        use_gpu: bool = False,
+        lazy_nlp: bool = False,
+        logger: Any = None,
+    ) -> None:
+        """
+        Initialiser l'enrichisseur.
+
+        Args:
+            model_name: Nom du modèle SpaCy à charger
+            batch_size: Taille des lots passés à nlp.pipe() dans enrich_batch
+            disable_components: Composants du pipeline SpaCy à désactiver
+            use_gpu: Exécuter le modèle sur GPU si disponible (utile pour les modèles
+                transformer type fr_dep_news_trf ; augmenter alors batch_size à 64-128)
+            lazy_nlp: Extraire les entités par expressions régulières sans SpaCy ;
+                l'analyse complète reste disponible via enrich_full()
+            logger: Logger optionnel
+        """
         super().__init__(logger or get_logger(__name__))
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.disable_components = tuple(disable_components)
+        self.use_gpu = use_gpu
+        self.lazy_nlp = lazy_nlp
         self.nlp: Language | None = None
-        self._load_model()
+        # En mode lazy, le modèle n'est chargé qu'au premier appel à enrich_full()
+        if not lazy_nlp:
+            self._load_model()
 
     def _load_model(self) -> None:
-        """Charger le modèle SpaCy."""
+        """Charger le modèle SpaCy (une seule fois par configuration)."""
+        cache_key = (self.model_name, self.disable_components, self.use_gpu)
+        cached = self._MODEL_CACHE.get(cache_key)
+        if cached is not None:
+            self.nlp = cached
+            return
+
+        if self.use_gpu:
+            self._enable_gpu()
+
         try:
             self.nlp = spacy.load(self.model_name)
             self.logger.info(f"Modèle SpaCy chargé: {self.model_name}")
@@ -37,6 +123,49 @@ class TextEnricher(BaseProcessor):
             if not self.nlp.has_pipe("ner"):
                 self.nlp.add_pipe("ner")
 
+        # Seuls les entités et les phrases sont utilisés : désactiver le reste
+        for name in self.disable_components:
+            if self.nlp.has_pipe(name):
+                self.nlp.disable_pipe(name)
+
+        # Sans parser, les frontières de phrases viennent du senter (désactivé par défaut
+        # dans les modèles français) ou, à défaut, d'un sentencizer à base de règles
+        if not any(self.nlp.has_pipe(name) for name in ("parser", "senter", "sentencizer")):
+            if "senter" in self.nlp.disabled:
+                self.nlp.enable_pipe("senter")
+            else:
+                self.nlp.add_pipe("sentencizer")
+
+        self._MODEL_CACHE[cache_key] = self.nlp
+
+    @classmethod
+    def preload(cls, model_name: str = "fr_core_news_md", **kwargs: Any) -> None:
+        """
+        Charger un modèle dans le cache partagé (à appeler au démarrage).
+
+        Args:
+            model_name: Nom du modèle SpaCy à charger
+            **kwargs: Options de configuration transmises au constructeur
+        """
+        cls(model_name, **kwargs)
+
+    def _enable_gpu(self) -> None:
+        """Activer le GPU pour SpaCy (doit précéder spacy.load), sinon rester sur CPU."""
+        try:
+            if not spacy.prefer_gpu():
+                self.logger.warning("Aucun GPU disponible pour SpaCy, exécution sur CPU")
+                return
+            try:
+                # Partager l'allocateur mémoire GPU avec PyTorch (modèles transformer)
+                from thinc.api import use_pytorch_for_gpu_memory
+
+                use_pytorch_for_gpu_memory()
+            except Exception as e:
+                self.logger.debug(f"Allocateur PyTorch non utilisé: {e}")
+            self.logger.info("SpaCy configuré pour utiliser le GPU")
+        except Exception as e:
+            self.logger.warning(f"Impossible d'activer le GPU pour SpaCy: {e}")
+
     async def enrich(self, text_block: TextBlock) -> TextBlock:
         """
         Enrichir un bloc de texte avec NLP.
@@ -47,96 +176,211 @@ class TextEnricher(BaseProcessor):
         Returns:
             Bloc de texte enrichi avec entités, relations, etc.
         """
+        if self.lazy_nlp:
+            return self._enrich_lazy(text_block)
+        return await self.enrich_full(text_block)
+
+    async def enrich_full(self, text_block: TextBlock) -> TextBlock:
+        """
+        Enrichir un bloc de texte avec l'analyse SpaCy complète, même en mode lazy.
+
+        Args:
+            text_block: Bloc de texte à enrichir
+
+        Returns:
+            Bloc de texte enrichi avec entités, relations, etc.
+        """
+        await self._ensure_model()
         if not self.nlp:
             raise EnrichmentError("Modèle SpaCy non chargé")
 
         try:
-            loop = asyncio.get_event_loop()
-            enriched = await loop.run_in_executor(None, self._enrich_sync, text_block)
+            loop = asyncio.get_running_loop()
+            enriched = await loop.run_in_executor(self._EXECUTOR, self._enrich_sync, text_block)
             return enriched
         except Exception as e:
             self.logger.exception(f"Erreur lors de l'enrichissement: {e}")
             raise EnrichmentError(f"Échec de l'enrichissement: {str(e)}")
 
+    async def _ensure_model(self) -> None:
+        """Charger le modèle SpaCy s'il ne l'est pas encore (mode lazy)."""
+        if self.nlp is None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._EXECUTOR, self._load_model)
+
+    def _enrich_lazy(self, text_block: TextBlock) -> TextBlock:
+        """Enrichissement léger par expressions régulières, sans SpaCy."""
+        try:
+            text = text_block.content
+            entities = self._extract_entities_regex(text)
+            sentences = list(_SENTENCE_RE.finditer(text))
+            token_count = len(text.split())
+
+            # Phrases clés : phrases dans lesquelles commence une entité
+            entity_starts = [entity["start"] for entity in entities]
+            key_phrases = [
+                sent.group().strip()
+                for sent in sentences
+                if any(sent.start() <= start < sent.end() for start in entity_starts)
+            ][:5]
+
+            structure: dict[str, Any] = {"headings": [], "paragraphs": [], "lists": []}
+            for sent in sentences:
+                sent_text = sent.group()
+                if len(sent_text.split()) <= 10 and sent_text.strip().isupper():
+                    structure["headings"].append({"text": sent_text, "level": 1})
+                else:
+                    structure["paragraphs"].append(sent_text)
+
+            return self._build_enriched_block(
+                text_block,
+                entities=entities,
+                structure=structure,
+                # Les relations de proximité nécessitent les positions de tokens SpaCy
+                relations=[],
+                key_phrases=key_phrases,
+                language="fr",
+                token_count=token_count,
+                sentence_count=len(sentences),
+                relevance_score=self._calculate_relevance_score(token_count, entities),
+            )
+        except Exception as e:
+            self.logger.exception(f"Erreur lors de l'enrichissement: {e}")
+            raise EnrichmentError(f"Échec de l'enrichissement: {str(e)}")
+
+    def _extract_entities_regex(self, text: str) -> list[dict[str, Any]]:
+        """Extraire des entités simples (emails, dates, montants, sociétés) par regex."""
+        entities = [
+            {
+                "text": match.group().strip(),
+                "label": label,
+                "start": match.start(),
+                "end": match.end(),
+                "confidence": confidence,
+            }
+            for label, pattern, confidence in _REGEX_ENTITY_PATTERNS
+            for match in pattern.finditer(text)
+        ]
+        entities.sort(key=lambda entity: entity["start"])
+        return entities
+
     def _enrich_sync(self, text_block: TextBlock) -> TextBlock:
         """Enrichissement synchrone."""
         if not self.nlp:
             return text_block
 
-        doc = self.nlp(text_block.content)
+        return self._enrich_from_doc(text_block, self.nlp(text_block.content))
+
+    def _enrich_batch_sync(self, text_blocks: list[TextBlock]) -> list[TextBlock]:
+        """Enrichissement synchrone par lots avec nlp.pipe()."""
+        if not self.nlp:
+            return text_blocks
+
+        docs = self.nlp.pipe(
+            (block.content for block in text_blocks), batch_size=self.batch_size
+        )
+        return [
+            self._enrich_from_doc(block, doc) for block, doc in zip(text_blocks, docs)
+        ]
+
+    def _enrich_from_doc(self, text_block: TextBlock, doc: Any) -> TextBlock:
+        """Construire le bloc enrichi depuis le Doc SpaCy déjà analysé."""
+        # Matérialiser phrases et entités une seule fois pour tous les helpers
+        sents = list(doc.sents)
+        ents = list(doc.ents)
 
         # Extraire les entités nommées
-        entities = self._extract_entities(doc)
+        entities = self._extract_entities(ents)
 
         # Détecter la structure
-        structure = self._detect_structure(doc)
+        structure = self._detect_structure(sents, doc.to_array(IS_LOWER))
 
         # Extraire les relations
-        relations = self._extract_relations(doc)
+        relations = self._extract_relations(ents)
 
         # Calculer le score de pertinence
-        relevance_score = self._calculate_relevance_score(doc, entities)
+        relevance_score = self._calculate_relevance_score(len(doc), entities)
 
         # Détecter la langue
         language = self._detect_language(doc)
 
         # Extraire les phrases clés
-        key_phrases = self._extract_key_phrases(doc)
+        key_phrases = self._extract_key_phrases(sents, ents)
+
+        return self._build_enriched_block(
+            text_block,
+            entities=entities,
+            structure=structure,
+            relations=relations,
+            key_phrases=key_phrases,
+            language=language,
+            token_count=len(doc),
+            sentence_count=len(sents),
+            relevance_score=relevance_score,
+        )
 
+    def _build_enriched_block(
+        self,
+        text_block: TextBlock,
+        *,
+        entities: list[dict[str, Any]],
+        structure: dict[str, Any],
+        relations: list[dict[str, Any]],
+        key_phrases: list[str],
+        language: str,
+        token_count: int,
+        sentence_count: int,
+        relevance_score: float,
+    ) -> TextBlock:
+        """Créer le bloc enrichi avec les résultats de l'analyse."""
         # Mettre à jour les métadonnées - créer un nouveau dict pour éviter les problèmes avec Pydantic
-        additional_metadata = dict(text_block.metadata.additional_metadata)
-        additional_metadata.update(
-            {
-                "entities": entities,
-                "structure": structure,
-                "relations": relations,
-                "key_phrases": key_phrases,
+        additional_metadata = {
+            **text_block.metadata.additional_metadata,
+            "entities": entities,
+            "structure": structure,
+            "relations": relations,
+            "key_phrases": key_phrases,
+            "language": language,
+            "token_count": token_count,
+            "sentence_count": sentence_count,
+            "relevance_score": relevance_score,
+        }
+
+        # Copier les modèles existants : seuls les champs modifiés sont remplacés,
+        # sans revalider les champs inchangés (position, section...)
+        updated_metadata = text_block.metadata.model_copy(
+            update={
                 "language": language,
-                "token_count": len(doc),
-                "sentence_count": len(list(doc.sents)),
-                "relevance_score": relevance_score,
+                "confidence": relevance_score,
+                "additional_metadata": additional_metadata,
             }
         )
+        return text_block.model_copy(update={"metadata": updated_metadata})
 
-        # Créer une nouvelle instance de ContentMetadata avec les valeurs mises à jour
-        from app.domain.value_objects.content_metadata import ContentMetadata
-        
-        updated_metadata = ContentMetadata(
-            page_number=text_block.metadata.page_number,
-            position=text_block.metadata.position,
-            order=text_block.metadata.order,
-            section_id=text_block.metadata.section_id,
-            section_level=text_block.metadata.section_level,
-            section_title=text_block.metadata.section_title,
-            language=language,
-            confidence=relevance_score,
-            extraction_method=text_block.metadata.extraction_method,
-            additional_metadata=additional_metadata,
-        )
+    def _extract_entities(self, ents: list[Any]) -> list[dict[str, Any]]:
+        """Extraire les entités nommées avec contexte."""
+        return [
+            {
+                "text": ent.text,
+                "label": ent.label_,
+                "start": ent.start_char,
+                "end": ent.end_char,
+                "confidence": 1.0,  # SpaCy ne fournit pas de confiance par défaut
+            }
+            for ent in ents
+        ]
 
-        # Créer un nouveau TextBlock avec les métadonnées mises à jour
-        return TextBlock(
-            content=text_block.content,
-            metadata=updated_metadata,
-        )
+    def _detect_structure(self, sents: list[Any], lower_mask: Any) -> dict[str, Any]:
+        """
+        Détecter la structure du texte (titres, paragraphes, listes).
 
-    def _extract_entities(self, doc: Any) -> list[dict[str, Any]]:
-        """Extraire les entités nommées avec contexte."""
-        entities = []
-        for ent in doc.ents:
-            entities.append(
-                {
-                    "text": ent.text,
-                    "label": ent.label_,
-                    "start": ent.start_char,
-                    "end": ent.end_char,
-                    "confidence": 1.0,  # SpaCy ne fournit pas de confiance par défaut
-                }
-            )
-        return entities
+        Args:
+            sents: Phrases du document
+            lower_mask: Tableau IS_LOWER par token (doc.to_array(IS_LOWER))
 
-    def _detect_structure(self, doc: Any) -> dict[str, Any]:
-        """Détecter la structure du texte (titres, paragraphes, listes)."""
+        Returns:
+            Titres, paragraphes et listes détectés
+        """
         structure = {
             "headings": [],
             "paragraphs": [],
@@ -144,45 +388,55 @@ class TextEnricher(BaseProcessor):
         }
 
         # Détecter les phrases courtes qui pourraient être des titres
-        for sent in doc.sents:
-            if len(sent) <= 10 and sent.text.strip().isupper():
-                structure["headings"].append({"text": sent.text, "level": 1})
+        for sent in sents:
+            text = sent.text
+            # Un token en minuscules exclut le titre sans examiner la chaîne ;
+            # seuls les candidats restants sont vérifiés exactement
+            if (
+                len(sent) <= 10
+                and not lower_mask[sent.start:sent.end].any()
+                and text.strip().isupper()
+            ):
+                structure["headings"].append({"text": text, "level": 1})
             else:
-                structure["paragraphs"].append(sent.text)
+                structure["paragraphs"].append(text)
 
         return structure
 
-    def _extract_relations(self, doc: Any) -> list[dict[str, Any]]:
+    def _extract_relations(self, entities: list[Any]) -> list[dict[str, Any]]:
         """Extraire les relations entre entités."""
-        relations = []
+        # Lire une seule fois les attributs des Span (chaque accès à .text recrée
+        # la chaîne) plutôt qu'à chaque paire
+        starts = [ent.start for ent in entities]
+        texts = [ent.text for ent in entities]
 
         # Relations basiques basées sur la proximité et les dépendances
-        entities = list(doc.ents)
-        for i, ent1 in enumerate(entities):
-            for ent2 in entities[i + 1 :]:
-                # Vérifier la proximité
-                distance = abs(ent1.start - ent2.start)
-                if distance < 50:  # Entités proches
-                    relations.append(
-                        {
-                            "entity1": ent1.text,
-                            "entity2": ent2.text,
-                            "type": "proximity",
-                            "distance": distance,
-                        }
-                    )
+        relations = []
+        for i, (start1, text1) in enumerate(zip(starts, texts)):
+            # doc.ents est trié par position : les voisines à moins de 50 tokens
+            # forment une plage contiguë
+            window_end = bisect_left(starts, start1 + 50, i + 1)
+            relations.extend(
+                {
+                    "entity1": text1,
+                    "entity2": texts[j],
+                    "type": "proximity",
+                    "distance": starts[j] - start1,
+                }
+                for j in range(i + 1, window_end)
+            )
 
         return relations
 
     def _calculate_relevance_score(
-        self, doc: Any, entities: list[dict[str, Any]]
+        self, token_count: int, entities: list[dict[str, Any]]
     ) -> float:
         """Calculer un score de pertinence basé sur la densité d'entités et mots-clés."""
-        if not doc:
+        if not token_count:
             return 0.0
 
         # Score basé sur la densité d'entités
-        entity_density = len(entities) / max(len(doc), 1)
+        entity_density = len(entities) / token_count
 
         # Score basé sur les mots-clés (entités importantes)
         important_labels = {"PERSON", "ORG", "MONEY", "DATE", "LOC"}
@@ -201,21 +455,44 @@ class TextEnricher(BaseProcessor):
             return doc.lang_
         return "fr"  # Par défaut
 
-    def _extract_key_phrases(self, doc: Any) -> list[str]:
+    def _extract_key_phrases(self, sents: list[Any], ents: list[Any]) -> list[str]:
         """Extraire les phrases clés (phrases avec entités)."""
-        key_phrases = []
-
-        for sent in doc.sents:
+        key_phrases: list[str] = []
+
+        # Phrases et entités sont triées par position : un seul parcours conjoint
+        ent_idx = 0
+        num_ents = len(ents)
+        for sent in sents:
+            # Ignorer les entités qui commencent avant la phrase
+            while ent_idx < num_ents and ents[ent_idx].start < sent.start:
+                ent_idx += 1
             # Si la phrase contient des entités, c'est une phrase clé
-            if any(ent in sent for ent in doc.ents):
+            if ent_idx < num_ents and ents[ent_idx].start < sent.end:
                 key_phrases.append(sent.text.strip())
+                if len(key_phrases) == 5:  # Limiter à 5 phrases
+                    break
 
-        return key_phrases[:5]  # Limiter à 5 phrases
+        return key_phrases
 
     async def enrich_batch(self, text_blocks: list[TextBlock]) -> list[TextBlock]:
-        """Enrichir plusieurs blocs de texte en parallèle."""
-        tasks = [self.enrich(block) for block in text_blocks]
-        return await asyncio.gather(*tasks)
+        """Enrichir plusieurs blocs de texte en un seul passage par lots de SpaCy."""
+        if self.lazy_nlp:
+            return [self._enrich_lazy(block) for block in text_blocks]
+
+        await self._ensure_model()
+        if not self.nlp:
+            raise EnrichmentError("Modèle SpaCy non chargé")
+        if not text_blocks:
+            return []
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._EXECUTOR, self._enrich_batch_sync, text_blocks
+            )
+        except Exception as e:
+            self.logger.exception(f"Erreur lors de l'enrichissement: {e}")
+            raise EnrichmentError(f"Échec de l'enrichissement: {str(e)}")
 
     async def process(self, *args: Any, **kwargs: Any) -> Any:
         """Implémentation de la méthode abstraite process."""
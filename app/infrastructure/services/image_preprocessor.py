@@ -6,8 +6,129 @@ from typing import Optional
 
 from app.core.logging import get_logger
 
+try:
+    import cv2
+except ImportError:  # OpenCV optionnel : repli sur le pipeline PIL
+    cv2 = None
+
 logger = get_logger(__name__)
 
+# Upscaling : facteur maximal, et taille au-delà de laquelle une image est considérée
+# comme déjà suffisamment résolue (quel que soit son DPI déclaré)
+MAX_UPSCALE_FACTOR = 2.0
+MIN_UNSCALED_SIDE = 1500
+# Hauteur de texte (px) en dessous de laquelle le mode agressif upscale
+MIN_TEXT_HEIGHT = 20
+
+# Redressement : angle minimal corrigé (évite les artefacts de rééchantillonnage)
+# et angle maximal considéré comme de l'inclinaison de lignes de texte
+MIN_SKEW_ANGLE = 0.3
+MAX_SKEW_ANGLE = 15.0
+
+# Binarisation de Sauvola : taille de fenêtre (impaire) et sensibilité k
+SAUVOLA_WINDOW_SIZE = 25
+SAUVOLA_K = 0.2
+
+# Noyau équivalent à ImageFilter.SHARPEN de PIL
+_SHARPEN_KERNEL = np.array(
+    [[-2, -2, -2], [-2, 32, -2], [-2, -2, -2]], dtype=np.float32
+) / 16.0
+
+
+def _mask_to_uint8(mask: np.ndarray) -> np.ndarray:
+    """Convertir un masque booléen en image 0/255, en place (sans nouvelle allocation)."""
+    result = mask.view(np.uint8)
+    result *= 255
+    return result
+
+
+def _sauvola_binarize(
+    arr: np.ndarray, window_size: int = SAUVOLA_WINDOW_SIZE, k: float = SAUVOLA_K
+) -> np.ndarray:
+    """
+    Binariser un tableau uint8 par seuil de Sauvola, calculé par fenêtre locale.
+
+    Même formule que skimage.filters.threshold_sauvola (bords en miroir, R = 127.5),
+    calculée par images intégrales : le coût ne dépend pas de la taille de fenêtre.
+    Utilisée par les variantes PIL et OpenCV du preprocessing avancé, qui donnent
+    ainsi la même binarisation.
+
+    Args:
+        arr: Image en niveaux de gris (uint8)
+        window_size: Côté (impair) de la fenêtre locale
+        k: Sensibilité du seuil à l'écart-type local
+
+    Returns:
+        Image binarisée (0/255, uint8)
+    """
+    radius = window_size // 2
+    padded = np.pad(arr.astype(np.float64), radius, mode="reflect")
+
+    # Images intégrales (avec une ligne et une colonne de zéros en tête)
+    height, width = padded.shape
+    integral = np.zeros((height + 1, width + 1))
+    integral_sq = np.zeros((height + 1, width + 1))
+    np.cumsum(np.cumsum(padded, axis=0), axis=1, out=integral[1:, 1:])
+    np.square(padded, out=padded)
+    np.cumsum(np.cumsum(padded, axis=0), axis=1, out=integral_sq[1:, 1:])
+
+    def window_sum(table: np.ndarray) -> np.ndarray:
+        return (
+            table[window_size:, window_size:]
+            - table[:-window_size, window_size:]
+            - table[window_size:, :-window_size]
+            + table[:-window_size, :-window_size]
+        )
+
+    area = float(window_size * window_size)
+    mean = window_sum(integral) / area
+    variance = window_sum(integral_sq) / area - mean * mean
+    std = np.sqrt(np.clip(variance, 0.0, None))
+
+    threshold = mean * (1.0 + k * (std / 127.5 - 1.0))
+    return _mask_to_uint8(arr > threshold)
+
+
+def preprocess_basic(image: Image.Image) -> Image.Image:
+    """
+    Preprocessing basique : niveaux de gris, contraste x2, netteté et médian 3x3.
+
+    Partagé par ImagePreprocessor et le repli d'OcrService. Avec OpenCV, les
+    étapes travaillent sur un seul tableau uint8 au lieu d'une image PIL par étape ;
+    hors pixels du bord, le résultat reste à un niveau de gris près de la chaîne PIL.
+
+    Args:
+        image: Image PIL à préprocesser
+
+    Returns:
+        Image préprocessée (mode "L")
+    """
+    # Convertir en niveaux de gris
+    if image.mode != "L":
+        image = image.convert("L")
+
+    if cv2 is not None:
+        arr = np.asarray(image)
+        # Contraste x2 autour de la moyenne, saturé sur [0, 255] comme avec PIL
+        # avant la netteté
+        mean = int(arr.mean() + 0.5)
+        arr = cv2.addWeighted(arr, 2.0, arr, 0, -mean)
+        arr = cv2.filter2D(arr, -1, _SHARPEN_KERNEL)
+        arr = cv2.medianBlur(arr, 3)
+        return Image.fromarray(arr, mode="L")
+
+    # Améliorer le contraste
+    enhancer = ImageEnhance.Contrast(image)
+    image = enhancer.enhance(2.0)
+
+    # Améliorer la netteté
+    image = image.filter(ImageFilter.SHARPEN)
+
+    # Réduire le bruit
+    image = image.filter(ImageFilter.MedianFilter(size=3))
+
+    return image
+
 
 class ImagePreprocessor:
     """Preprocessing avancé d'images pour optimiser l'OCR."""
@@ -25,6 +146,8 @@ class ImagePreprocessor:
         """
         Préprocesser une image pour améliorer l'OCR.
 
+        L'image reçue n'est jamais modifiée : une nouvelle image est renvoyée.
+
         Args:
             image: Image PIL à préprocesser
             method: Méthode de preprocessing ('basic', 'advanced', 'aggressive')
@@ -44,26 +167,15 @@ class ImagePreprocessor:
 
     def _preprocess_basic(self, image: Image.Image) -> Image.Image:
         """Preprocessing basique (méthode actuelle)."""
-        # Convertir en niveaux de gris
-        if image.mode != "L":
-            image = image.convert("L")
-
-        # Améliorer le contraste
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(2.0)
-
-        # Améliorer la netteté
-        image = image.filter(ImageFilter.SHARPEN)
-
-        # Réduire le bruit
-        image = image.filter(ImageFilter.MedianFilter(size=3))
-
-        return image
+        return preprocess_basic(image)
 
     def _preprocess_advanced(
         self, image: Image.Image, target_dpi: int = 300
     ) -> Image.Image:
         """Preprocessing avancé avec plusieurs améliorations."""
+        if cv2 is not None:
+            return self._preprocess_advanced_cv(image, target_dpi)
+
         # 1. Upscaling si nécessaire
         image = self._upscale_if_needed(image, target_dpi)
 
@@ -89,12 +201,77 @@ class ImagePreprocessor:
 
         return image
 
+    def _preprocess_advanced_cv(
+        self, image: Image.Image, target_dpi: int = 300
+    ) -> Image.Image:
+        """
+        Variante OpenCV du preprocessing avancé.
+
+        Mêmes étapes que la variante PIL : contraste adaptatif, binarisation de
+        Sauvola, filtre médian 3x3 et renforcement de la netteté. L'image n'est
+        convertie qu'une fois en tableau NumPy en entrée et une fois en Image PIL
+        en sortie ; les étapes intermédiaires restent en ndarray.
+
+        Le résultat est proche de la variante PIL sans lui être identique : les
+        arrondis du contraste et de la netteté peuvent différer d'un niveau de
+        gris, et le filtre de netteté d'OpenCV traite aussi les pixels du bord,
+        que PIL laisse inchangés.
+        """
+        image = self._upscale_if_needed(image, target_dpi)
+        if image.mode != "L":
+            image = image.convert("L")
+        image = self._correct_rotation(image)
+
+        arr = np.asarray(image)
+        # Tampon uint8 réutilisé par les étapes intermédiaires
+        tmp = np.empty_like(arr)
+
+        # Amélioration du contraste adaptatif
+        src = self._enhance_contrast_array(arr, out=tmp)
+
+        # Binarisation adaptative : même seuil de Sauvola que la variante PIL
+        work = _sauvola_binarize(src)
+
+        # Débruitage : un seul filtre médian (bruit poivre et sel de la binarisation)
+        cv2.medianBlur(work, 3, dst=tmp)
+
+        # Amélioration finale de la netteté
+        cv2.filter2D(tmp, -1, _SHARPEN_KERNEL, dst=work)
+
+        return Image.fromarray(work, mode="L")
+
+    def _enhance_contrast_array(
+        self, arr: np.ndarray, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Améliorer le contraste d'un tableau uint8 (équivalent à ImageEnhance.Contrast).
+
+        Args:
+            arr: Image en niveaux de gris (uint8)
+            out: Tampon de sortie optionnel de même forme
+
+        Returns:
+            Tableau avec contraste amélioré (arr inchangé si le contraste suffit)
+        """
+        # Moyenne et écart-type en un seul passage
+        mean_value, std_value = cv2.meanStdDev(arr)
+        contrast = float(std_value[0, 0])
+        if contrast < 30:
+            factor = min(2.5, 30.0 / max(contrast, 1.0))
+            mean = int(mean_value[0, 0] + 0.5)
+            # out = mean + factor * (arr - mean), saturé sur [0, 255]
+            arr = cv2.addWeighted(arr, factor, arr, 0.0, mean * (1.0 - factor), dst=out)
+            self.logger.debug(f"Contraste amélioré (facteur: {factor:.2f})")
+        return arr
+
     def _preprocess_aggressive(
         self, image: Image.Image, target_dpi: int = 300
     ) -> Image.Image:
         """Preprocessing agressif pour images de mauvaise qualité."""
-        # Upscaling plus agressif
-        image = self._upscale_if_needed(image, target_dpi * 2)
+        # Upscaling plus agressif, seulement si le texte est petit
+        text_height = self._estimate_text_height(image)
+        if text_height is None or text_height < MIN_TEXT_HEIGHT:
+            image = self._upscale_if_needed(image, target_dpi * 2)
 
         # Convertir en niveaux de gris
         if image.mode != "L":
@@ -130,13 +307,21 @@ class ImagePreprocessor:
         Returns:
             Image upscalée si nécessaire
         """
-        # Estimation de la résolution actuelle (approximative)
-        # On suppose que l'image fait environ 8.5x11 pouces si c'est un document
         width, height = image.size
-        estimated_dpi = max(width, height) / 11.0  # Approximation
+        if max(width, height) >= MIN_UNSCALED_SIDE:
+            # Une image de cette taille est assez résolue pour l'OCR, même si elle
+            # porte un DPI par défaut (72/96) sans rapport avec la numérisation
+            return image
+
+        dpi = image.info.get("dpi")
+        if dpi and min(dpi) > 0:
+            current_dpi = float(min(dpi))
+        else:
+            # Estimation approximative : on suppose un document de 8.5x11 pouces
+            current_dpi = max(width, height) / 11.0
 
-        if estimated_dpi < target_dpi:
-            scale_factor = target_dpi / estimated_dpi
+        if current_dpi < target_dpi:
+            scale_factor = min(target_dpi / current_dpi, MAX_UPSCALE_FACTOR)
             new_width = int(width * scale_factor)
             new_height = int(height * scale_factor)
 
@@ -149,6 +334,39 @@ class ImagePreprocessor:
 
         return image
 
+    def _estimate_text_height(self, image: Image.Image) -> Optional[float]:
+        """
+        Estimer la hauteur médiane des caractères par composantes connexes.
+
+        Args:
+            image: Image à analyser
+
+        Returns:
+            Hauteur estimée en pixels, ou None si l'estimation est impossible
+        """
+        if cv2 is None:
+            return None
+
+        try:
+            gray = np.asarray(image if image.mode == "L" else image.convert("L"))
+            # Analyse sur une copie réduite pour limiter le coût
+            scale = min(1.0, 1000 / max(gray.shape))
+            if scale < 1.0:
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+            _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+            heights = stats[1:, cv2.CC_STAT_HEIGHT]
+
+            # Ignorer le bruit et les grands éléments (cadres, illustrations)
+            heights = heights[(heights >= 2) & (heights <= gray.shape[0] // 10)]
+            if heights.size == 0:
+                return None
+            return float(np.median(heights)) / scale
+        except Exception as e:
+            self.logger.debug(f"Estimation de la hauteur de texte impossible: {e}")
+            return None
+
     def _correct_rotation(self, image: Image.Image) -> Image.Image:
         """
         Détecter et corriger la rotation de l'image.
@@ -159,15 +377,66 @@ class ImagePreprocessor:
         Returns:
             Image corrigée
         """
-        # Pour l'instant, on utilise auto_rotate de PIL
-        # Une implémentation plus avancée pourrait utiliser Hough Transform
+        # Orientation EXIF (0/90/180/270)
         try:
-            # Tenter la correction automatique
             image = ImageOps.exif_transpose(image)
         except Exception:
             pass
 
-        return image
+        if cv2 is None:
+            return image
+
+        # Inclinaison réelle du scan détectée par transformée de Hough
+        try:
+            arr = np.asarray(image if image.mode == "L" else image.convert("L"))
+            angle = self._detect_skew(arr)
+            if angle is None or abs(angle) < MIN_SKEW_ANGLE:
+                return image
+
+            arr = np.asarray(image)
+            height, width = arr.shape[:2]
+            # Angle positif = rotation antihoraire, qui compense une ligne descendante
+            matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+            rotated = cv2.warpAffine(
+                arr, matrix, (width, height),
+                flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE,
+            )
+            self.logger.debug(f"Inclinaison corrigée ({angle:.2f}°)")
+            return Image.fromarray(rotated, mode=image.mode)
+        except Exception as e:
+            self.logger.debug(f"Détection de l'inclinaison impossible: {e}")
+            return image
+
+    def _detect_skew(self, gray: np.ndarray) -> Optional[float]:
+        """
+        Estimer l'inclinaison des lignes de texte.
+
+        Args:
+            gray: Image en niveaux de gris (uint8)
+
+        Returns:
+            Angle médian des lignes quasi horizontales en degrés, ou None
+        """
+        # Détection sur une copie réduite à 600 px de large
+        scale = min(1.0, 600 / gray.shape[1])
+        if scale < 1.0:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        edges = cv2.Canny(gray, 50, 150)
+        lines = cv2.HoughLinesP(
+            edges, 1, np.pi / 1800, threshold=100,
+            minLineLength=gray.shape[1] // 4, maxLineGap=20,
+        )
+        if lines is None:
+            return None
+
+        # (N, 1, 4) avec OpenCV 4, (N, 4) avec OpenCV 5
+        x1, y1, x2, y2 = lines.reshape(-1, 4).astype(np.float64).T
+        angles = np.degrees(np.arctan2(y2 - y1, x2 - x1))
+        angles = angles[np.abs(angles) < MAX_SKEW_ANGLE]
+        if angles.size == 0:
+            return None
+        return float(np.median(angles))
 
     def _enhance_contrast_adaptive(self, image: Image.Image) -> Image.Image:
         """
@@ -180,13 +449,13 @@ class ImagePreprocessor:
             Image avec contraste amélioré
         """
         # Convertir en numpy pour analyse
-        img_array = np.array(image)
-
-        # Calculer l'histogramme
-        hist, _ = np.histogram(img_array.flatten(), 256, [0, 256])
+        img_array = np.asarray(image)
 
         # Calculer le contraste actuel (écart-type)
-        contrast = np.std(img_array)
+        if cv2 is not None:
+            contrast = float(cv2.meanStdDev(img_array)[1][0, 0])
+        else:
+            contrast = float(img_array.std(dtype=np.float32))
 
         # Si le contraste est faible, l'améliorer
         if contrast < 30:
@@ -209,24 +478,9 @@ class ImagePreprocessor:
             Image binarisée
         """
         try:
-            # Convertir en numpy
-            img_array = np.array(image)
-
-            # Méthode adaptative : utiliser un seuil adaptatif par région
-            # Pour simplifier, on utilise Otsu global
-            from skimage.filters import threshold_otsu
-            from skimage import img_as_ubyte
-
-            threshold = threshold_otsu(img_array)
-            binary = img_array > threshold
-            binary_img = img_as_ubyte(binary)
-
-            # Convertir back en PIL Image
+            # Méthode adaptative : seuil de Sauvola calculé par région
+            binary_img = _sauvola_binarize(np.asarray(image))
             return Image.fromarray(binary_img, mode="L")
-        except ImportError:
-            # Si scikit-image n'est pas disponible, utiliser une méthode simple
-            self.logger.debug("scikit-image non disponible, utilisation de binarisation simple")
-            return self._simple_binarization(image)
         except Exception as e:
             self.logger.warning(f"Erreur lors de la binarisation adaptative: {e}")
             return self._simple_binarization(image)
@@ -243,12 +497,11 @@ class ImagePreprocessor:
         """
         try:
             from skimage.filters import threshold_otsu
-            from skimage import img_as_ubyte
 
-            img_array = np.array(image)
+            img_array = np.asarray(image)
             threshold = threshold_otsu(img_array)
             binary = img_array > threshold
-            binary_img = img_as_ubyte(binary)
+            binary_img = _mask_to_uint8(binary)
 
             return Image.fromarray(binary_img, mode="L")
         except ImportError:
@@ -268,14 +521,21 @@ class ImagePreprocessor:
             Image binarisée
         """
         # Convertir en numpy
-        img_array = np.array(image)
+        img_array = np.asarray(image)
 
         # Seuil adaptatif basé sur la médiane
-        threshold = np.median(img_array)
+        if img_array.dtype == np.uint8:
+            # Médiane par histogramme en O(N) : pour x entier, x > médiane équivaut
+            # à x > médiane inférieure, qui est la première valeur où le cumul
+            # dépasse (N - 1) // 2
+            cdf = np.bincount(img_array.ravel(), minlength=256).cumsum()
+            threshold = int(np.searchsorted(cdf, (img_array.size - 1) // 2, side="right"))
+        else:
+            threshold = np.median(img_array)
 
         # Binariser
         binary = img_array > threshold
-        binary_img = (binary * 255).astype(np.uint8)
+        binary_img = _mask_to_uint8(binary)
 
         return Image.fromarray(binary_img, mode="L")
 
@@ -289,14 +549,9 @@ class ImagePreprocessor:
         Returns:
             Image débruitée
         """
-        # Appliquer un filtre médian pour réduire le bruit
-        image = image.filter(ImageFilter.MedianFilter(size=3))
-
-        # Appliquer un léger flou gaussien pour lisser
-        # Note: PIL n'a pas de filtre gaussien direct, on utilise BoxBlur
-        image = image.filter(ImageFilter.BoxBlur(radius=0.5))
-
-        return image
+        # Un seul passage : le filtre médian supprime le bruit poivre et sel laissé
+        # par la binarisation, un flou supplémentaire ne ferait qu'estomper les bords
+        return image.filter(ImageFilter.MedianFilter(size=3))
 
     def _morphological_denoising(self, image: Image.Image) -> Image.Image:
         """
@@ -310,9 +565,8 @@ class ImagePreprocessor:
         """
         try:
             from skimage.morphology import opening, closing
-            from skimage import img_as_ubyte
 
-            img_array = np.array(image)
+            img_array = np.asarray(image)
 
             # Opening pour supprimer le bruit blanc
             opened = opening(img_array > 128)
@@ -320,7 +574,7 @@ class ImagePreprocessor:
             # Closing pour remplir les trous
             closed = closing(opened)
 
-            result = img_as_ubyte(closed)
+            result = _mask_to_uint8(closed)
 
             return Image.fromarray(result, mode="L")
         except ImportError:
@@ -1,12 +1,163 @@
 """Service de correction post-OCR pour améliorer la qualité du texte extrait."""
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_MONTHS_UPPER = (
+    "OCTOBRE|JANVIER|FÉVRIER|MARS|AVRIL|MAI|JUIN|JUILLET|AOÛT|SEPTEMBRE|NOVEMBRE|DÉCEMBRE"
+)
+
+# Règles des étapes 3 à 5 (dates, nombres, mots), reprises dans la passe unique.
+# Ne figurent ici que les règles que pattern_corrections et common_corrections,
+# appliqués avant, laissent encore utiles (ex. "cudi", "d'fos", "tol N°" ou
+# "Pérode" sont déjà corrigés à ce stade).
+_DATE_CORRECTIONS = (
+    # "2 mbre" -> "25 décembre" dans un contexte de dates
+    (
+        re.compile(r"(\d{1,2})\s+(décembre|mbre)\s+(\d{4})", re.IGNORECASE),
+        lambda m: f"{m.group(1)} décembre {m.group(3)}",
+    ),
+)
+
+_NUMBER_CORRECTIONS = (
+    (re.compile(r"\b(\d)\s+(\d)\s+(\d{4})\b"), r"\1\2\3"),  # "2 0 2 5" -> "2025"
+)
+
+_FRENCH_WORD_CORRECTIONS = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in (
+        (r"\bplus\s+d['']infos\b", "plus d'infos"),
+        (r"\bREPUBLIQUE\s+DEMOCRATIQUE\s+DU\s+CONGO\b", "REPUBLIQUE DEMOCRATIQUE DU CONGO"),
+        # "ou" -> "DU" dans les dates (avant les mois), après correction de "mbre"
+        (rf"\bou\s+(\d{{1,2}})\s+({_MONTHS_UPPER})", r"DU \1 \2"),
+        # Ajouter "DE LA" si manquant dans certains contextes
+        (r"\bJOURNAL\s+OFFICIEL\s+REPUBLIQUE\b", "JOURNAL OFFICIEL\nDE LA\nREPUBLIQUE"),
+    )
+)
+
+
+def _join_digits_then_date(match: re.Match) -> str:
+    """Recoller "2 0 2025" et normaliser la date qui suit éventuellement l'année."""
+    joined = match.group(1) + match.group(2) + match.group(3)
+    if match.group(4) is None:
+        return joined
+    return f"{joined} décembre {match.group(4)}"
+
+
+def _day_month_to_du(match: re.Match) -> str:
+    """"ou 16 OCTOBRE" -> "DU 16 OCTOBRE" ; "ou 2 mbre" -> "DU 2 décembre"."""
+    month = "décembre" if match.group(2) is None else match.group(2)
+    return f"DU {match.group(1)} {month}"
+
+
+# Passe unique de correct_text : les règles des étapes 3 à 5 (dates, nombres, mots)
+# y sont reprises, sauf celles réécrites ci-dessous pour donner le même résultat
+# que les passes successives lorsque des correspondances se chevauchent ou
+# qu'une correction en déclenchait une autre.
+_SINGLE_PASS_REWRITES = {
+    # L'année de "2 0 2024 DÉCEMBRE 2025" est aussi le début d'une date à normaliser
+    r"\b(\d)\s+(\d)\s+(\d{4})\b": (
+        re.compile(r"\b(\d)\s+(\d)\s+(\d{4})\b(?i:\s+(?:décembre|mbre)\s+(\d{4}))?"),
+        _join_digits_then_date,
+    ),
+    # "ou 2 mbre" devenait "ou 2 décembre" (étape 2) puis "DU 2 décembre" (étape 5)
+    rf"\bou\s+(\d{{1,2}})\s+({_MONTHS_UPPER})": (
+        re.compile(rf"\bou\s+(\d{{1,2}})\s+(?:({_MONTHS_UPPER})|mbre\b)", re.IGNORECASE),
+        _day_month_to_du,
+    ),
+    # Ne plus consommer "REPUBLIQUE", laissé aux règles suivantes
+    # (ex. "REPUBLIQUE DEMOCRATIQUE DU CONGO")
+    r"\bJOURNAL\s+OFFICIEL\s+REPUBLIQUE\b": (
+        re.compile(r"\bJOURNAL\s+OFFICIEL\s+(?=REPUBLIQUE\b)", re.IGNORECASE),
+        "JOURNAL OFFICIEL\nDE LA\n",
+    ),
+}
+_SINGLE_PASS_CORRECTIONS = tuple(
+    _SINGLE_PASS_REWRITES.get(pattern.pattern, (pattern, replacement))
+    for pattern, replacement in (
+        *_DATE_CORRECTIONS,
+        *_NUMBER_CORRECTIONS,
+        *_FRENCH_WORD_CORRECTIONS,
+    )
+)
+
+# Fragments sans lesquels aucune règle de pattern_corrections ni des étapes 3 à 5
+# ne peut s'appliquer (les clés de common_corrections s'y ajoutent à l'init)
+_CORRECTION_TRIGGERS = (
+    r"mbre",
+    r"\b(?:cudi|cudl|eudi)\b",
+    r"d'(?:in)?fos",
+    r"\btol\s+N°",
+    r"\bou\s+\d",
+    r"pérode",
+    r"\b[BM]\s+Période",
+    r"REPUBLIQUE",
+    r"JOURNAL",
+    r"\d\s+\d\s+\d{4}",
+)
+
+# Nettoyage final en un seul balayage : un blanc contenant au moins un retour à
+# la ligne (espaces de fin et de début de ligne compris), ou une suite d'espaces
+_WHITESPACE_RE = re.compile(r"[^\S\n]*\n\s*| {2,}")
+
+
+def _normalize_whitespace(match: re.Match) -> str:
+    """Remplacer un blanc : un espace, un retour à la ligne ou une ligne vide (max 2)."""
+    newlines = match.group().count("\n")
+    if not newlines:
+        return " "
+    return "\n\n" if newlines > 1 else "\n"
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Construire une alternance regex factorisée en trie.
+
+    Les préfixes communs ne sont testés qu'une fois ; à préfixe égal, le mot le
+    plus long est essayé en premier.
+
+    Args:
+        words: Motifs regex déjà échappés (un caractère ou une séquence d'échappement
+            par position)
+
+    Returns:
+        Motif regex équivalent à l'alternance des mots
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for token in re.findall(r"\\.|.", word, re.DOTALL):
+            node = node.setdefault(token, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [token + build(child) for token, child in node.items() if token]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class _RuleMatch:
+    """Vue sur les groupes d'une règle au sein d'un match de la passe unique."""
+
+    __slots__ = ("_match", "_offset")
+
+    def __init__(self, match: re.Match, offset: int) -> None:
+        self._match = match
+        self._offset = offset
+
+    def group(self, index: int = 0) -> Optional[str]:
+        """Groupe ``index`` de la règle (0 : toute la correspondance)."""
+        return self._match.group(self._offset + index)
+
 
 class OcrCorrector:
     """Service de correction du texte OCR pour corriger les erreurs courantes."""
@@ -18,18 +169,8 @@ class OcrCorrector:
         # Dictionnaire de corrections courantes
         self.common_corrections = {
             # Corrections de caractères fréquemment mal reconnus
-            "cudi": "Jeudi",
-            "cudl": "Jeudi",
-            "eudi": "Jeudi",  # J manquant au début
             "mbre": "décembre",
-            "mbre 2025": "décembre 2025",
-            "2 mbre": "25 décembre",
-            "d'fos": "d'infos",
-            "lus d'infos": "plus d'infos",  # p manquant au début
-            "lus d'fos": "plus d'infos",
-            "plus d'fos": "plus d'infos",
-            "plus d'infos": "plus d'infos",
-            # Corrections de mots français courants
+            # Normalisation de la casse (insensible à la casse : "republique" -> "REPUBLIQUE")
             "REPUBLIQUE": "REPUBLIQUE",
             "DEMOCRATIQUE": "DEMOCRATIQUE",
             "CONGO": "CONGO",
@@ -38,48 +179,91 @@ class OcrCorrector:
             "25 décembre": "25 décembre",
             "31 décembre": "31 décembre",
             # Corrections spécifiques identifiées
-            "tol N°": "LOI N°",  # "tol" → "LOI"
             "ou 16": "DU 16",  # "ou" → "DU" dans les dates
-            "Pérode": "Période",  # "Pérode" → "Période"
-            "Pérode 1": "Période 1",
-            "Pérode 2": "Période 2",
         }
 
         # Patterns de correction avec regex
         self.pattern_corrections = [
             # Dates : "2 mbre 2025" -> "25 décembre 2025"
             (r"\b(\d{1,2})\s+mbre\s+(\d{4})\b", self._correct_date_month),
-            # "cudi" ou "eudi" -> "Jeudi" (J manquant)
-            (r"\bcudi\b", "Jeudi"),
-            (r"\bcudl\b", "Jeudi"),
-            (r"\beudi\b", "Jeudi"),  # J manquant au début
-            # "lus d'infos" -> "plus d'infos" (p manquant)
-            (r"\blus\s+d'infos\b", "plus d'infos"),
-            (r"\blus\s+d'fos\b", "plus d'infos"),
-            # "d'fos" -> "d'infos"
+            # "cudi", "cudl" ou "eudi" -> "Jeudi" (J mal reconnu ou manquant)
+            (r"\b(?:cudi|cudl|eudi)\b", "Jeudi"),
+            # "lus d'infos" / "lus d'fos" -> "plus d'infos" (p manquant)
+            (r"\blus\s+d'(?:in)?fos\b", "plus d'infos"),
+            # "d'fos" -> "d'infos" (couvre aussi "plus d'fos")
             (r"d'fos\b", "d'infos"),
-            (r"plus\s+d'fos\b", "plus d'infos"),
             # "tol N°" -> "LOI N°" (tol mal reconnu)
             (r"\btol\s+N°", "LOI N°"),
             # "ou 16" -> "DU 16" dans les dates (ou mal reconnu)
             (r"\bou\s+16\s+OCTOBRE", "DU 16 OCTOBRE"),
-            (r"\bou\s+(\d{1,2})\s+(OCTOBRE|JANVIER|FÉVRIER|MARS|AVRIL|MAI|JUIN|JUILLET|AOÛT|SEPTEMBRE|NOVEMBRE|DÉCEMBRE)", r"DU \1 \2"),  # Général pour dates
-            # "Pérode" -> "Période" (doit être fait en premier)
+            # Général pour dates
+            (rf"\bou\s+(\d{{1,2}})\s+({_MONTHS_UPPER})", r"DU \1 \2"),
+            # "Pérode" -> "Période"
             (r"\bPérode\b", "Période"),
-            # "B Pérode" ou "M Pérode" -> "BB Période" (avant correction Pérode -> Période)
-            (r"\bB\s+Pérode", "BB Période"),
-            (r"\bM\s+Pérode", "BB Période"),
-            # "B Période" ou "M Période" -> "BB Période" (après correction Pérode -> Période)
-            (r"\bB\s+Période", "BB Période"),
-            (r"\bM\s+Période", "BB Période"),
+            # "B Pérode", "M Période"... -> "BB Période" ("Pérode" collé au mot suivant
+            # échappe à la règle précédente)
+            (r"\b[BM]\s+Péri?ode", "BB Période"),
             # "DE LA" manquant dans "REPUBLIQUE DEMOCRATIQUE"
             (r"REPUBLIQUE\s+DEMOCRATIQUE", "REPUBLIQUE DEMOCRATIQUE"),
-            # Correction des espaces multiples
+            # Correction des espaces multiples (retours à la ligne compris)
             (r"\s+", " "),
-            # Correction des retours à la ligne multiples
-            (r"\n{3,}", "\n\n"),
         ]
 
+        # Versions précompilées, utilisées par correct_text
+        self._compiled_pattern_corrections = [
+            (re.compile(pattern, re.IGNORECASE), replacement)
+            for pattern, replacement in self.pattern_corrections
+        ]
+
+        # Étapes 2 à 5 (mots du dictionnaire, dates, nombres, mots français) fusionnées
+        # en une seule alternance : un balayage du texte au lieu d'un par règle.
+        # Les règles des étapes 3 à 5 passent en premier : à position égale, leur
+        # correspondance plus longue inclut la correction du mot du dictionnaire.
+        # Un mot contenant un mot corrigé avant lui (ex. "2 mbre" après "mbre") ne
+        # pouvait jamais correspondre lors des remplacements successifs : il est écarté.
+        word_rules: list[tuple[re.Pattern, str]] = []
+        kept_words: list[str] = []
+        for wrong, correct in self.common_corrections.items():
+            if any(pattern.search(wrong) for pattern, _ in word_rules):
+                continue
+            word_rules.append(
+                (re.compile(r"\b" + re.escape(wrong) + r"\b", re.IGNORECASE), correct)
+            )
+            kept_words.append(wrong)
+        # Les mots du dictionnaire forment une seule règle : une alternance
+        # factorisée en trie, le remplacement étant retrouvé par simple lookup
+        self._word_rules = word_rules
+        self._word_replacements: dict[str, str] = {}
+        for wrong, (_, correct) in zip(kept_words, word_rules):
+            self._word_replacements.setdefault(wrong.casefold(), correct)
+        words_pattern = _trie_pattern(re.escape(wrong) for wrong in kept_words)
+        words_rule = (
+            re.compile(rf"\b{words_pattern}\b", re.IGNORECASE),
+            self._replace_word,
+        )
+        self._single_pass_rules = [*_SINGLE_PASS_CORRECTIONS, words_rule]
+        self._single_pass_re = re.compile(
+            "|".join(
+                f"(?P<r{index}>(?{'i' if pattern.flags & re.IGNORECASE else ''}:"
+                f"{pattern.pattern}))"
+                for index, (pattern, _) in enumerate(self._single_pass_rules)
+            )
+        )
+        # Règle et position de ses groupes dans l'alternance, par nom de groupe :
+        # le remplacement lit directement les groupes de la passe unique
+        self._single_pass_dispatch = {
+            f"r{index}": (self._single_pass_re.groupindex[f"r{index}"], replacement)
+            for index, (_, replacement) in enumerate(self._single_pass_rules)
+        }
+
+        # Détection rapide : un texte sans aucun déclencheur n'est pas corrigé
+        self._trigger_re = re.compile(
+            "|".join(
+                [*_CORRECTION_TRIGGERS, *(re.escape(wrong) for wrong in self.common_corrections)]
+            ),
+            re.IGNORECASE,
+        )
+
         # Mois en français
         self.months = {
             "janvier": 1,
@@ -110,142 +294,80 @@ class OcrCorrector:
         if not text or not text.strip():
             return text
 
-        corrected = text
-
-        # 1. Corrections de patterns avec regex
-        for pattern, replacement in self.pattern_corrections:
-            if callable(replacement):
-                # Si c'est une fonction, l'appeler
-                corrected = re.sub(pattern, replacement, corrected, flags=re.IGNORECASE)
-            else:
-                corrected = re.sub(pattern, replacement, corrected, flags=re.IGNORECASE)
-
-        # 2. Corrections de mots complets (insensible à la casse)
-        for wrong, correct in self.common_corrections.items():
-            # Remplacer les occurrences entières du mot
-            pattern = r"\b" + re.escape(wrong) + r"\b"
-            corrected = re.sub(pattern, correct, corrected, flags=re.IGNORECASE)
+        # Aucune règle ne peut s'appliquer : seule reste la normalisation des espaces
+        # (règle "\s+" de pattern_corrections puis _clean_text)
+        if not self._trigger_re.search(text):
+            return " ".join(text.split())
 
-        # 3. Correction contextuelle des dates
-        corrected = self._correct_dates(corrected)
+        corrected = text
 
-        # 4. Correction des nombres mal reconnus
-        corrected = self._correct_numbers(corrected)
+        # 1. Corrections de patterns avec regex (remplacement texte ou fonction)
+        for pattern, replacement in self._compiled_pattern_corrections:
+            corrected = pattern.sub(replacement, corrected)
 
-        # 5. Correction des mots français courants mal reconnus
-        corrected = self._correct_french_words(corrected)
+        # 2-5. Mots complets, dates, nombres et mots français en une seule passe
+        corrected = self._single_pass_re.sub(self._apply_single_pass_rule, corrected)
 
         # 6. Nettoyage final
         corrected = self._clean_text(corrected)
 
         return corrected
 
-    def _correct_date_month(self, match: re.Match) -> str:
-        """
-        Corriger les dates avec mois abrégé mal reconnu.
-
-        Args:
-            match: Match regex
-
-        Returns:
-            Date corrigée
-        """
-        day = match.group(1)
-        year = match.group(2)
-
-        # Si le jour est "2" et qu'on est dans un contexte de décembre, c'est probablement "25"
-        # Sinon, on garde le jour tel quel
-        if day == "2" and "décembre" in match.string.lower():
-            day = "25"
-
-        return f"{day} décembre {year}"
-
-    def _correct_dates(self, text: str) -> str:
+    def _apply_single_pass_rule(self, match: re.Match) -> str:
         """
-        Corriger les dates mal reconnues.
+        Appliquer la règle reconnue par la passe unique.
 
         Args:
-            text: Texte à corriger
+            match: Match de l'alternance (le groupe nommé r<index> désigne la règle)
 
         Returns:
-            Texte avec dates corrigées
+            Texte de remplacement
         """
-        # Pattern pour "cudi 2 mbre 2025" -> "Jeudi 25 décembre 2025"
-        pattern = r"\b(cudi|cudl)\s+(\d{1,2})\s+mbre\s+(\d{4})\b"
-        replacement = r"Jeudi 25 décembre \3"
-
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-
-        # Pattern pour "2 mbre" -> "25 décembre" dans un contexte de dates
-        pattern = r"(\d{1,2})\s+(décembre|mbre)\s+(\d{4})"
-        text = re.sub(
-            pattern,
-            lambda m: f"{m.group(1)} décembre {m.group(3)}",
-            text,
-            flags=re.IGNORECASE,
-        )
-
-        return text
+        offset, replacement = self._single_pass_dispatch[match.lastgroup]
+        if callable(replacement):
+            return replacement(_RuleMatch(match, offset))
+        # Remplacements littéraux uniquement (aucune référence de groupe)
+        return replacement
 
-    def _correct_numbers(self, text: str) -> str:
+    def _replace_word(self, match: "_RuleMatch") -> str:
         """
-        Corriger les nombres mal reconnus.
+        Remplacer un mot du dictionnaire reconnu par la passe unique.
 
         Args:
-            text: Texte à corriger
+            match: Correspondance de la règle des mots du dictionnaire
 
         Returns:
-            Texte avec nombres corrigés
+            Correction du mot
         """
-        # Corrections spécifiques pour les nombres courants
-        corrections = {
-            r"\b2\s+mbre\b": "25 décembre",
-            r"\b(\d)\s+(\d)\s+(\d{4})\b": r"\1\2\3",  # "2 0 2 5" -> "2025"
-        }
-
-        for pattern, replacement in corrections.items():
-            text = re.sub(pattern, replacement, text)
-
-        return text
+        word = match.group()
+        correct = self._word_replacements.get(word.casefold())
+        if correct is not None:
+            return correct
+        # Repli si le pliage de casse diffère de re.IGNORECASE (caractères rares)
+        for pattern, correct in self._word_rules:
+            if pattern.fullmatch(word):
+                return correct
+        return word
 
-    def _correct_french_words(self, text: str) -> str:
+    def _correct_date_month(self, match: re.Match) -> str:
         """
-        Corriger les mots français courants mal reconnus.
+        Corriger les dates avec mois abrégé mal reconnu.
 
         Args:
-            text: Texte à corriger
+            match: Match regex
 
         Returns:
-            Texte avec mots corrigés
+            Date corrigée
         """
-        # Dictionnaire de corrections de mots français
-        word_corrections = {
-            r"\bplus\s+d['']fos\b": "plus d'infos",
-            r"\bplus\s+d['']infos\b": "plus d'infos",
-            r"\bd['']fos\b": "d'infos",
-            r"\blus\s+d['']infos\b": "plus d'infos",  # p manquant
-            r"\bREPUBLIQUE\s+DEMOCRATIQUE\s+DU\s+CONGO\b": "REPUBLIQUE DEMOCRATIQUE DU CONGO",
-            # "tol" -> "LOI" dans les contextes légaux
-            r"\btol\s+N°": "LOI N°",
-            r"\btol\s+N°\s+(\d+/\d+)": r"LOI N° \1",
-            # "ou" -> "DU" dans les dates (avant les mois)
-            r"\bou\s+(\d{1,2})\s+(OCTOBRE|JANVIER|FÉVRIER|MARS|AVRIL|MAI|JUIN|JUILLET|AOÛT|SEPTEMBRE|NOVEMBRE|DÉCEMBRE)": r"DU \1 \2",
-            # "ou 16" -> "DU 16" (cas général)
-            r"\bou\s+16\s+OCTOBRE": "DU 16 OCTOBRE",
-            # "Pérode" -> "Période"
-            r"\bPérode\b": "Période",
-            # "B Pérode" ou "M Pérode" -> "BB Période"
-            r"\bB\s+Pérode": "BB Période",
-            r"\bM\s+Période": "BB Période",
-            r"\b[BM]\s+Période": "BB Période",
-            # Ajouter "DE LA" si manquant dans certains contextes
-            r"\bJOURNAL\s+OFFICIEL\s+REPUBLIQUE\b": "JOURNAL OFFICIEL\nDE LA\nREPUBLIQUE",
-        }
+        day = match.group(1)
+        year = match.group(2)
 
-        for pattern, replacement in word_corrections.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        # Si le jour est "2" et qu'on est dans un contexte de décembre, c'est probablement "25"
+        # Sinon, on garde le jour tel quel
+        if day == "2" and "décembre" in match.string.lower():
+            day = "25"
 
-        return text
+        return f"{day} décembre {year}"
 
     def _clean_text(self, text: str) -> str:
         """
@@ -257,19 +379,9 @@ class OcrCorrector:
         Returns:
             Texte nettoyé
         """
-        # Supprimer les espaces multiples
-        text = re.sub(r" +", " ", text)
-
-        # Supprimer les retours à la ligne multiples (garder max 2)
-        text = re.sub(r"\n{3,}", "\n\n", text)
-
-        # Supprimer les espaces en début/fin de ligne
-        lines = text.split("\n")
-        lines = [line.strip() for line in lines]
-        text = "\n".join(lines)
-
-        # Supprimer les lignes vides multiples
-        text = re.sub(r"\n\s*\n\s*\n", "\n\n", text)
+        # Espaces multiples, espaces de début/fin de ligne et lignes vides
+        # multiples (garder max 2 retours à la ligne) en une seule passe
+        text = _WHITESPACE_RE.sub(_normalize_whitespace, text)
 
         return text.strip()
 
@@ -304,3 +416,14 @@ class OcrCorrector:
 
         return corrected, adjusted_confidence
 
+
+@lru_cache()
+def get_ocr_corrector() -> OcrCorrector:
+    """
+    Obtenir le correcteur partagé (cached).
+
+    Les règles ne sont compilées qu'une fois par processus. Le correcteur n'a aucun
+    état modifié pendant une correction et peut donc être partagé entre threads :
+    tout état ajouté à l'avenir devra rester local aux appels.
+    """
+    return OcrCorrector()
@@ -1,24 +1,187 @@
 """Service OCR réutilisable pour l'extraction de texte depuis des images."""
 
 import asyncio
+import hashlib
 import os
 import platform
 import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
+import numpy as np
 import pytesseract
 from PIL import Image
 
 from app.config import get_settings
 from app.core.logging import get_logger
-from app.infrastructure.services.image_preprocessor import ImagePreprocessor
-from app.infrastructure.services.ocr_corrector import OcrCorrector
+from app.infrastructure.services.image_preprocessor import (
+    ImagePreprocessor,
+    preprocess_basic,
+)
+from app.infrastructure.services.ocr_corrector import get_ocr_corrector
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Confiance à partir de laquelle une tentative OCR est jugée suffisante : les
+# tentatives restantes sont alors abandonnées
+EARLY_EXIT_CONFIDENCE = 0.92
+
+# Pool dédié à l'OCR : ne partage pas l'exécuteur par défaut de la boucle
+# avec le reste de l'application
+_OCR_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="ocr")
+
+# Nombre maximal de processus Tesseract simultanés, pour tout le processus
+TESSERACT_MAX_PROCESSES = os.cpu_count() or 1
+
+# Pool partagé des tentatives multi-PSM et sémaphore couvrant chaque lancement de
+# Tesseract (tentatives comme appels directs depuis _OCR_POOL)
+_TESSERACT_POOL = ThreadPoolExecutor(
+    max_workers=TESSERACT_MAX_PROCESSES, thread_name_prefix="tesseract"
+)
+_TESSERACT_SLOTS = threading.BoundedSemaphore(TESSERACT_MAX_PROCESSES)
+
+# Langues pour lesquelles Tesseract a déjà été préchauffé dans ce processus
+_warmed_up_langs: set[str] = set()
+
+# Images préprocessées récemment, par (empreinte des octets, méthode) : une même
+# image soumise à nouveau (ex. avec une autre langue) n'est pas retraitée
+PREPROCESSED_CACHE_SIZE = 6
+_preprocessed_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+_preprocessed_cache_lock = threading.Lock()
+
+
+@lru_cache()
+def _find_tesseract() -> Optional[str]:
+    """
+    Détecter automatiquement l'emplacement de Tesseract (cached, une fois par processus).
+
+    Returns:
+        Chemin vers l'exécutable Tesseract ou None si non trouvé
+    """
+    # Vérifier d'abord si tesseract est dans le PATH
+    tesseract_path = shutil.which("tesseract")
+    if tesseract_path:
+        logger.debug(f"Tesseract trouvé dans PATH: {tesseract_path}")
+        return tesseract_path
+
+    # Sur Windows, chercher dans les emplacements communs
+    if platform.system() == "Windows":
+        common_paths = [
+            r"C:\Program Files\Tesseract-OCR\tesseract.exe",
+            r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
+            r"C:\Users\{}\AppData\Local\Programs\Tesseract-OCR\tesseract.exe".format(
+                os.getenv("USERNAME", "")
+            ),
+            r"C:\Tesseract-OCR\tesseract.exe",
+        ]
+
+        for path in common_paths:
+            if Path(path).exists():
+                logger.debug(f"Tesseract trouvé: {path}")
+                return path
+
+    # Sur Linux/macOS, chercher dans les emplacements standards
+    elif platform.system() in ("Linux", "Darwin"):
+        common_paths = [
+            "/usr/bin/tesseract",
+            "/usr/local/bin/tesseract",
+            "/opt/homebrew/bin/tesseract",  # macOS avec Homebrew sur Apple Silicon
+        ]
+
+        for path in common_paths:
+            if Path(path).exists():
+                logger.debug(f"Tesseract trouvé: {path}")
+                return path
+
+    logger.debug("Tesseract non trouvé automatiquement")
+    return None
+
+
+# Versions de Tesseract déjà obtenues, par exécutable
+_TESSERACT_VERSIONS: dict[str, object] = {}
+_TESSERACT_VERSIONS_LOCK = threading.Lock()
+
+
+def _get_tesseract_version() -> object:
+    """
+    Obtenir la version de l'exécutable Tesseract configuré (cached).
+
+    Seules les réponses valides sont mémorisées : un échec est retenté à
+    l'appel suivant.
+
+    Returns:
+        Version renvoyée par pytesseract.get_tesseract_version
+    """
+    tesseract_cmd = str(pytesseract.pytesseract.tesseract_cmd)
+    with _TESSERACT_VERSIONS_LOCK:
+        if tesseract_cmd not in _TESSERACT_VERSIONS:
+            _TESSERACT_VERSIONS[tesseract_cmd] = pytesseract.get_tesseract_version()
+        return _TESSERACT_VERSIONS[tesseract_cmd]
+
+
+def average_confidence(confidences: Sequence) -> float:
+    """
+    Calculer la confiance moyenne d'une colonne "conf" de image_to_data.
+
+    Les valeurs -1 (éléments sans texte reconnu) sont ignorées. Accepte les
+    valeurs numériques comme les chaînes des anciennes versions de pytesseract.
+
+    Args:
+        confidences: Confiances Tesseract (0-100 ou -1)
+
+    Returns:
+        Confiance moyenne entre 0.0 et 1.0 (0.0 si aucun mot reconnu)
+    """
+    values = np.asarray(confidences, dtype=np.float64)
+    recognized = values != -1
+    if not recognized.any():
+        return 0.0
+    return float(values.mean(where=recognized)) / 100.0
+
+
+def _text_from_ocr_data(ocr_data: dict) -> str:
+    """
+    Reconstruire le texte à partir de la sortie de image_to_data.
+
+    Comme image_to_string : mots séparés par un espace, lignes par un retour
+    à la ligne et paragraphes par une ligne vide.
+
+    Args:
+        ocr_data: Dictionnaire renvoyé par image_to_data (Output.DICT)
+
+    Returns:
+        Texte reconnu, sans blancs en début/fin
+    """
+    parts: list[str] = []
+    previous_line: Optional[tuple] = None
+    for block, paragraph, line, word in zip(
+        ocr_data.get("block_num", []),
+        ocr_data.get("par_num", []),
+        ocr_data.get("line_num", []),
+        ocr_data.get("text", []),
+    ):
+        word = str(word).strip()
+        if not word:
+            continue
+        current_line = (block, paragraph, line)
+        if previous_line is not None:
+            if current_line[:2] != previous_line[:2]:
+                parts.append("\n\n")
+            elif current_line != previous_line:
+                parts.append("\n")
+            else:
+                parts.append(" ")
+        parts.append(word)
+        previous_line = current_line
+    return "".join(parts)
+
 
 class OcrService:
     """Service OCR pour extraire le texte depuis des images avec Tesseract."""
@@ -29,6 +192,7 @@ class OcrService:
         use_advanced_preprocessing: bool = True,
         use_correction: bool = True,
         multi_attempt: bool = True,
+        warm_up_on_init: bool = False,
     ) -> None:
         """
         Initialiser le service OCR.
@@ -38,12 +202,15 @@ class OcrService:
             use_advanced_preprocessing: Utiliser le preprocessing avancé (défaut: True)
             use_correction: Utiliser la correction post-OCR (défaut: True)
             multi_attempt: Essayer plusieurs configurations (défaut: True)
+            warm_up_on_init: Lancer warm_up() au premier is_available() réussi
+                (défaut: False)
         """
         self.logger = logger
         self._tesseract_available: Optional[bool] = None
         self.use_advanced_preprocessing = use_advanced_preprocessing
         self.use_correction = use_correction
         self.multi_attempt = multi_attempt
+        self.warm_up_on_init = warm_up_on_init
         
         # Initialiser les services
         if self.use_advanced_preprocessing:
@@ -52,7 +219,7 @@ class OcrService:
             self.image_preprocessor = None
             
         if self.use_correction:
-            self.ocr_corrector = OcrCorrector()
+            self.ocr_corrector = get_ocr_corrector()
         else:
             self.ocr_corrector = None
         
@@ -67,7 +234,7 @@ class OcrService:
             
             # Si aucun chemin n'est fourni, essayer de détecter automatiquement
             if not self._tesseract_cmd:
-                self._tesseract_cmd = self._find_tesseract()
+                self._tesseract_cmd = _find_tesseract()
 
         # Configurer le chemin Tesseract si trouvé
         if self._tesseract_cmd:
@@ -96,7 +263,7 @@ class OcrService:
                         f"Le chemin Tesseract n'existe pas: {self._tesseract_cmd}, "
                         "tentative de détection automatique"
                     )
-                    self._tesseract_cmd = self._find_tesseract()
+                    self._tesseract_cmd = _find_tesseract()
                     if self._tesseract_cmd:
                         tesseract_path = Path(self._tesseract_cmd)
                 
@@ -108,51 +275,6 @@ class OcrService:
             except Exception as e:
                 self.logger.warning(f"Impossible de configurer le chemin Tesseract: {e}")
 
-    def _find_tesseract(self) -> Optional[str]:
-        """
-        Détecter automatiquement l'emplacement de Tesseract.
-
-        Returns:
-            Chemin vers l'exécutable Tesseract ou None si non trouvé
-        """
-        # Vérifier d'abord si tesseract est dans le PATH
-        tesseract_path = shutil.which("tesseract")
-        if tesseract_path:
-            self.logger.debug(f"Tesseract trouvé dans PATH: {tesseract_path}")
-            return tesseract_path
-
-        # Sur Windows, chercher dans les emplacements communs
-        if platform.system() == "Windows":
-            common_paths = [
-                r"C:\Program Files\Tesseract-OCR\tesseract.exe",
-                r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
-                r"C:\Users\{}\AppData\Local\Programs\Tesseract-OCR\tesseract.exe".format(
-                    os.getenv("USERNAME", "")
-                ),
-                r"C:\Tesseract-OCR\tesseract.exe",
-            ]
-
-            for path in common_paths:
-                if Path(path).exists():
-                    self.logger.debug(f"Tesseract trouvé: {path}")
-                    return path
-
-        # Sur Linux/macOS, chercher dans les emplacements standards
-        elif platform.system() in ("Linux", "Darwin"):
-            common_paths = [
-                "/usr/bin/tesseract",
-                "/usr/local/bin/tesseract",
-                "/opt/homebrew/bin/tesseract",  # macOS avec Homebrew sur Apple Silicon
-            ]
-
-            for path in common_paths:
-                if Path(path).exists():
-                    self.logger.debug(f"Tesseract trouvé: {path}")
-                    return path
-
-        self.logger.debug("Tesseract non trouvé automatiquement")
-        return None
-
     async def is_available(self) -> bool:
         """
         Vérifier si Tesseract OCR est disponible.
@@ -165,7 +287,7 @@ class OcrService:
 
         # Si aucun chemin n'a été configuré, essayer de le trouver
         if not self._tesseract_cmd:
-            found_path = self._find_tesseract()
+            found_path = _find_tesseract()
             if found_path:
                 self._tesseract_cmd = found_path
                 try:
@@ -175,15 +297,17 @@ class OcrService:
                     self.logger.warning(f"Impossible de configurer Tesseract: {e}")
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             version = await loop.run_in_executor(
-                None, pytesseract.get_tesseract_version
+                _OCR_POOL, _get_tesseract_version
             )
             self._tesseract_available = version is not None
             if self._tesseract_available:
                 self.logger.info(
                     f"Tesseract OCR disponible (version: {version})"
                 )
+                if self.warm_up_on_init:
+                    await self.warm_up()
             else:
                 self.logger.warning("Tesseract OCR non disponible")
             return self._tesseract_available
@@ -192,14 +316,14 @@ class OcrService:
             # Si l'erreur indique que le chemin n'est pas trouvé, essayer de le détecter
             if "tesseract" in str(e).lower() or "not found" in str(e).lower():
                 if not self._tesseract_cmd:
-                    found_path = self._find_tesseract()
+                    found_path = _find_tesseract()
                     if found_path:
                         self._tesseract_cmd = found_path
                         try:
                             pytesseract.pytesseract.tesseract_cmd = found_path
                             # Réessayer après avoir configuré le chemin
                             version = await loop.run_in_executor(
-                                None, pytesseract.get_tesseract_version
+                                _OCR_POOL, _get_tesseract_version
                             )
                             self._tesseract_available = version is not None
                             if self._tesseract_available:
@@ -213,6 +337,33 @@ class OcrService:
             self._tesseract_available = False
             return False
 
+    async def warm_up(self, lang: str = "fra+eng") -> None:
+        """
+        Lancer Tesseract une première fois sur une image vierge.
+
+        Le premier appel lit les modèles de langue depuis le disque ; les suivants
+        les trouvent dans le cache du système. Effectué une fois par processus et
+        par langue, sans effet sur la disponibilité en cas d'échec.
+
+        Args:
+            lang: Langues à préparer (défaut: fra+eng)
+        """
+        if lang in _warmed_up_langs:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                _OCR_POOL,
+                self._run_tesseract,
+                Image.new("L", (32, 32), 255),
+                lang,
+                "--psm 6 --oem 3",
+            )
+            _warmed_up_langs.add(lang)
+            self.logger.info(f"Tesseract préchauffé (langues: {lang})")
+        except Exception as e:
+            self.logger.warning(f"Impossible de préchauffer Tesseract: {e}")
+
     async def extract_text(
         self, image_data: bytes, lang: str = "fra+eng"
     ) -> Tuple[str, float]:
@@ -230,6 +381,29 @@ class OcrService:
             ValueError: Si Tesseract n'est pas disponible
             RuntimeError: Si l'extraction échoue
         """
+        return await self._run_extraction(self._extract_text_from_bytes, image_data, lang)
+
+    async def extract_text_pil(
+        self, image: Image.Image, lang: str = "fra+eng"
+    ) -> Tuple[str, float]:
+        """
+        Extraire le texte d'une image déjà décodée (évite de redécoder ses octets).
+
+        Args:
+            image: Image PIL (non modifiée)
+            lang: Langues à utiliser pour l'OCR (défaut: fra+eng)
+
+        Returns:
+            Tuple contenant le texte extrait et le niveau de confiance (0.0-1.0)
+
+        Raises:
+            ValueError: Si Tesseract n'est pas disponible
+            RuntimeError: Si l'extraction échoue
+        """
+        return await self._run_extraction(self._extract_text_from_image, image, lang)
+
+    async def _run_extraction(self, extract, *args) -> Tuple[str, float]:
+        """Vérifier Tesseract puis lancer l'extraction dans le pool OCR."""
         if not await self.is_available():
             raise ValueError(
                 "Tesseract OCR n'est pas disponible. "
@@ -237,35 +411,41 @@ class OcrService:
             )
 
         try:
-            loop = asyncio.get_event_loop()
-            if self.multi_attempt:
-                result = await loop.run_in_executor(
-                    None, self._extract_text_multi_attempt, image_data, lang
-                )
-            else:
-                result = await loop.run_in_executor(
-                    None, self._extract_text_sync, image_data, lang
-                )
-            return result
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_OCR_POOL, extract, *args)
         except Exception as e:
             self.logger.exception(f"Erreur lors de l'extraction OCR: {e}")
             raise RuntimeError(f"Échec de l'extraction OCR: {str(e)}") from e
 
+    def _extract_text_from_bytes(self, image_data: bytes, lang: str) -> Tuple[str, float]:
+        """Décoder l'image une seule fois puis lancer l'extraction."""
+        image = Image.open(BytesIO(image_data))
+        image_digest = hashlib.blake2b(image_data, digest_size=16).digest()
+        return self._extract_text_from_image(image, lang, image_digest)
+
+    def _extract_text_from_image(
+        self, image: Image.Image, lang: str, image_digest: Optional[bytes] = None
+    ) -> Tuple[str, float]:
+        """Lancer l'extraction multi-tentatives ou simple selon la configuration."""
+        if self.multi_attempt:
+            return self._extract_text_multi_attempt(image, lang, image_digest)
+        return self._extract_text_sync(image, lang, image_digest)
+
     def _extract_text_multi_attempt(
-        self, image_data: bytes, lang: str
+        self, original_image: Image.Image, lang: str, image_digest: Optional[bytes] = None
     ) -> Tuple[str, float]:
         """
         Extraction avec plusieurs tentatives pour obtenir le meilleur résultat.
 
         Args:
-            image_data: Données binaires de l'image
+            original_image: Image originale (non modifiée)
             lang: Langues à utiliser
+            image_digest: Empreinte des octets de l'image, pour réutiliser un
+                preprocessing récent (optionnel)
 
         Returns:
             Tuple (texte, confiance) du meilleur résultat
         """
-        # Charger l'image originale
-        original_image = Image.open(BytesIO(image_data))
 
         # PSM modes à tester (Page Segmentation Modes)
         # 3 = Segmentation automatique complète (défaut)
@@ -281,76 +461,62 @@ class OcrService:
             else ["basic"]
         )
 
-        results: list[Tuple[str, float, dict]] = []
-
-        # Essayer différentes combinaisons
-        for preprocess_method in preprocessing_methods:
-            # Préprocesser l'image
-            if self.use_advanced_preprocessing and self.image_preprocessor:
-                processed_image = self.image_preprocessor.preprocess(
-                    original_image.copy(), method=preprocess_method
-                )
-            else:
-                processed_image = self._preprocess_image_basic(original_image.copy())
-
-            # Essayer chaque PSM mode
-            for psm in psm_modes:
-                try:
-                    # Configuration Tesseract
-                    config = f"--psm {psm} --oem 3"  # OEM 3 = LSTM OCR Engine
-
-                    # Extraire le texte
-                    ocr_text = pytesseract.image_to_string(
-                        processed_image, lang=lang, config=config
-                    )
-                    ocr_data = pytesseract.image_to_data(
-                        processed_image,
-                        output_type=pytesseract.Output.DICT,
-                        lang=lang,
-                        config=config,
-                    )
-
-                    # Calculer la confiance
-                    confidences = [
-                        int(conf) for conf in ocr_data.get("conf", []) if conf != "-1"
-                    ]
-                    avg_confidence = (
-                        sum(confidences) / len(confidences) / 100.0
-                        if confidences
-                        else 0.0
-                    )
-
-                    # Nettoyer le texte
-                    text = ocr_text.strip() if ocr_text else ""
-
-                    if text:
-                        results.append(
-                            (
-                                text,
-                                avg_confidence,
-                                {"psm": psm, "preprocess": preprocess_method},
-                            )
-                        )
-                except Exception as e:
-                    self.logger.debug(
-                        f"Erreur avec PSM {psm} et preprocessing {preprocess_method}: {e}"
-                    )
-                    continue
+        # Préprocesser l'image une fois par méthode
+        processed_images = {
+            preprocess_method: self._preprocess_cached(
+                original_image, image_digest, preprocess_method
+            )
+            for preprocess_method in preprocessing_methods
+        }
+
+        # Essayer les combinaisons en parallèle : un processus Tesseract par mode PSM,
+        # qui traite en une fois les images de toutes les méthodes de preprocessing
+        # (modèles chargés une fois par lot). Les lots passent par le pool partagé,
+        # borné pour tous les appels ; les combinaisons les plus souvent gagnantes
+        # passent en premier.
+        futures = {
+            _TESSERACT_POOL.submit(
+                self._run_psm_batch,
+                [processed_images[method] for method in preprocessing_methods],
+                preprocessing_methods,
+                psm,
+                lang,
+            ): psm
+            for psm in psm_modes
+        }
+        try:
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                if any(
+                    result and result[1] >= EARLY_EXIT_CONFIDENCE
+                    for future in done
+                    for result in future.result()
+                ):
+                    # Résultat suffisant : abandonner les lots non démarrés
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+
+        attempt_results = {}
+        for future, psm in futures.items():
+            if future.done() and not future.cancelled():
+                for preprocess_method, result in zip(preprocessing_methods, future.result()):
+                    attempt_results[(preprocess_method, psm)] = result
+
+        # Conserver l'ordre des tentatives (départage des égalités au tri)
+        results: list[Tuple[str, float, dict]] = [
+            attempt_results[(preprocess_method, psm)]
+            for preprocess_method in preprocessing_methods
+            for psm in psm_modes
+            if attempt_results.get((preprocess_method, psm))
+        ]
 
         # Si aucun résultat, essayer sans preprocessing
         if not results:
             try:
-                ocr_text = pytesseract.image_to_string(original_image, lang=lang)
-                ocr_data = pytesseract.image_to_data(
-                    original_image, output_type=pytesseract.Output.DICT, lang=lang
-                )
-                confidences = [
-                    int(conf) for conf in ocr_data.get("conf", []) if conf != "-1"
-                ]
-                avg_confidence = (
-                    sum(confidences) / len(confidences) / 100.0 if confidences else 0.0
-                )
-                text = ocr_text.strip() if ocr_text else ""
+                text, avg_confidence = self._run_tesseract(original_image, lang)
                 if text:
                     results.append((text, avg_confidence, {"psm": 3, "preprocess": "none"}))
             except Exception as e:
@@ -377,49 +543,23 @@ class OcrService:
 
         return best_text, best_confidence
 
-    def _extract_text_sync(self, image_data: bytes, lang: str) -> Tuple[str, float]:
+    def _extract_text_sync(
+        self, image: Image.Image, lang: str, image_digest: Optional[bytes] = None
+    ) -> Tuple[str, float]:
         """Extraction synchrone du texte (méthode simple, sans multi-tentatives)."""
-        # Charger l'image depuis les bytes
-        image = Image.open(BytesIO(image_data))
-
         # Préprocesser l'image
-        if self.use_advanced_preprocessing and self.image_preprocessor:
-            processed_image = self.image_preprocessor.preprocess(image, method="advanced")
-        else:
-            processed_image = self._preprocess_image_basic(image)
+        processed_image = self._preprocess_cached(image, image_digest, "advanced")
 
         # Extraire le texte avec OCR
         try:
             config = "--psm 6 --oem 3"  # PSM 6 pour texte uniforme, OEM 3 pour LSTM
-            ocr_text = pytesseract.image_to_string(
-                processed_image, lang=lang, config=config
-            )
-            ocr_data = pytesseract.image_to_data(
-                processed_image,
-                output_type=pytesseract.Output.DICT,
-                lang=lang,
-                config=config,
-            )
+            text, avg_confidence = self._run_tesseract(processed_image, lang, config)
         except Exception as e:
             self.logger.warning(
                 f"Erreur OCR avec preprocessing: {e}, tentative sans preprocessing"
             )
             # Fallback: essayer sans preprocessing
-            ocr_text = pytesseract.image_to_string(image, lang=lang)
-            ocr_data = pytesseract.image_to_data(
-                image, output_type=pytesseract.Output.DICT, lang=lang
-            )
-
-        # Calculer la confiance moyenne
-        confidences = [
-            int(conf) for conf in ocr_data.get("conf", []) if conf != "-1"
-        ]
-        avg_confidence = (
-            sum(confidences) / len(confidences) / 100.0 if confidences else 0.0
-        )
-
-        # Nettoyer le texte
-        text = ocr_text.strip() if ocr_text else ""
+            text, avg_confidence = self._run_tesseract(image, lang)
 
         # Appliquer la correction si activée
         if self.use_correction and self.ocr_corrector:
@@ -429,33 +569,208 @@ class OcrService:
 
         return text, avg_confidence
 
-    def _preprocess_image_basic(self, image: Image.Image) -> Image.Image:
+    def _preprocess_cached(
+        self, image: Image.Image, image_digest: Optional[bytes], method: str
+    ) -> Image.Image:
         """
-        Préprocesser l'image de manière basique (fallback).
+        Préprocesser l'image en réutilisant un résultat récent pour les mêmes octets.
 
         Args:
-            image: Image PIL à préprocesser
+            image: Image PIL originale (non modifiée)
+            image_digest: Empreinte des octets de l'image (None : pas de cache)
+            method: Méthode de preprocessing
 
         Returns:
-            Image préprocessée
+            Image préprocessée (partagée : ne pas la modifier)
+        """
+        use_preprocessor = bool(self.use_advanced_preprocessing and self.image_preprocessor)
+        # Sans preprocesseur avancé, toutes les méthodes reviennent au basique
+        key = (image_digest, method if use_preprocessor else None)
+        if image_digest is not None:
+            with _preprocessed_cache_lock:
+                processed_image = _preprocessed_cache.get(key)
+                if processed_image is not None:
+                    _preprocessed_cache.move_to_end(key)
+                    return processed_image
+
+        # Le preprocessing ne modifie pas l'image reçue : pas de copie nécessaire
+        if use_preprocessor:
+            processed_image = self.image_preprocessor.preprocess(image, method=method)
+        else:
+            processed_image = self._preprocess_image_basic(image)
+
+        if image_digest is None:
+            return processed_image
+        with _preprocessed_cache_lock:
+            _preprocessed_cache[key] = processed_image
+            while len(_preprocessed_cache) > PREPROCESSED_CACHE_SIZE:
+                _preprocessed_cache.popitem(last=False)
+        return processed_image
+
+    def _run_psm_batch(
+        self,
+        images: list[Image.Image],
+        preprocess_methods: list[str],
+        psm: int,
+        lang: str,
+    ) -> list[Optional[Tuple[str, float, dict]]]:
+        """
+        Effectuer les tentatives OCR d'un mode PSM sur toutes les images préprocessées.
+
+        Args:
+            images: Images préprocessées
+            preprocess_methods: Méthode de preprocessing de chaque image
+            psm: Page Segmentation Mode
+            lang: Langues à utiliser
+
+        Returns:
+            Pour chaque image, tuple (texte, confiance, configuration) ou None
         """
-        from PIL import ImageEnhance, ImageFilter
+        config = f"--psm {psm} --oem 3"  # OEM 3 = LSTM OCR Engine
+        try:
+            outputs = self._run_tesseract_batch(images, lang, config)
+        except Exception as e:
+            if len(images) == 1:
+                self.logger.debug(
+                    f"Erreur avec PSM {psm} et preprocessing {preprocess_methods[0]}: {e}"
+                )
+                return [None]
+            self.logger.debug(
+                f"Erreur du lot PSM {psm}: {e}, tentatives image par image"
+            )
+            return [
+                self._run_one_attempt(image, psm, preprocess_method, lang)
+                for image, preprocess_method in zip(images, preprocess_methods)
+            ]
 
-        # Convertir en niveaux de gris si nécessaire
-        if image.mode != "L":
-            image = image.convert("L")
+        return [
+            (text, avg_confidence, {"psm": psm, "preprocess": preprocess_method})
+            if text
+            else None
+            for (text, avg_confidence), preprocess_method in zip(outputs, preprocess_methods)
+        ]
 
-        # Améliorer le contraste
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(2.0)
+    def _run_one_attempt(
+        self, image: Image.Image, psm: int, preprocess_method: str, lang: str
+    ) -> Optional[Tuple[str, float, dict]]:
+        """
+        Effectuer une tentative OCR (un mode PSM sur une image préprocessée).
 
-        # Améliorer la netteté
-        image = image.filter(ImageFilter.SHARPEN)
+        Args:
+            image: Image préprocessée
+            psm: Page Segmentation Mode
+            preprocess_method: Méthode de preprocessing utilisée (pour le suivi)
+            lang: Langues à utiliser
 
-        # Réduire le bruit (débruitage)
-        image = image.filter(ImageFilter.MedianFilter(size=3))
+        Returns:
+            Tuple (texte, confiance, configuration) ou None si aucun texte
+        """
+        try:
+            # Configuration Tesseract
+            config = f"--psm {psm} --oem 3"  # OEM 3 = LSTM OCR Engine
+
+            # Extraire le texte et la confiance
+            text, avg_confidence = self._run_tesseract(image, lang, config)
+        except Exception as e:
+            self.logger.debug(
+                f"Erreur avec PSM {psm} et preprocessing {preprocess_method}: {e}"
+            )
+            return None
 
-        return image
+        if not text:
+            return None
+        return text, avg_confidence, {"psm": psm, "preprocess": preprocess_method}
+
+    def _run_tesseract(
+        self, image: Image.Image, lang: str, config: str = ""
+    ) -> Tuple[str, float]:
+        """
+        Lancer Tesseract une seule fois et en tirer le texte et la confiance.
+
+        image_to_data contient déjà les mots reconnus : le texte est reconstruit
+        à partir de ses colonnes au lieu d'un second appel à image_to_string,
+        qui relancerait toute la reconnaissance.
+
+        Args:
+            image: Image PIL à analyser
+            lang: Langues à utiliser
+            config: Options Tesseract (ex. "--psm 6 --oem 3")
+
+        Returns:
+            Tuple (texte, confiance moyenne 0.0-1.0)
+        """
+        with _TESSERACT_SLOTS:
+            ocr_data = pytesseract.image_to_data(
+                image, output_type=pytesseract.Output.DICT, lang=lang, config=config
+            )
+
+        avg_confidence = average_confidence(ocr_data.get("conf", []))
+        return _text_from_ocr_data(ocr_data), avg_confidence
+
+    def _run_tesseract_batch(
+        self, images: list[Image.Image], lang: str, config: str = ""
+    ) -> list[Tuple[str, float]]:
+        """
+        Lancer un seul processus Tesseract sur plusieurs images (liste de fichiers).
+
+        Args:
+            images: Images PIL à analyser
+            lang: Langues à utiliser
+            config: Options Tesseract, communes à toutes les images
+
+        Returns:
+            Tuple (texte, confiance moyenne 0.0-1.0) pour chaque image, dans l'ordre
+        """
+        if len(images) == 1:
+            return [self._run_tesseract(images[0], lang, config)]
+
+        with tempfile.TemporaryDirectory(prefix="ocr_") as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            image_paths = []
+            for index, image in enumerate(images):
+                image_path = tmp_path / f"{index}.png"
+                image.save(image_path)
+                image_paths.append(str(image_path))
+            list_path = tmp_path / "images.txt"
+            list_path.write_text("\n".join(image_paths) + "\n", encoding="utf-8")
+
+            output_base = tmp_path / "output"
+            with _TESSERACT_SLOTS:
+                pytesseract.pytesseract.run_tesseract(
+                    str(list_path),
+                    str(output_base),
+                    extension="tsv",
+                    lang=lang,
+                    config=f"-c tessedit_create_tsv=1 {config}",
+                )
+            tsv = output_base.with_suffix(".tsv").read_text(encoding="utf-8")
+
+        ocr_data = pytesseract.pytesseract.file_to_dict(tsv, "\t", -1)
+
+        # page_num numérote les images de la liste à partir de 1
+        columns = ("block_num", "par_num", "line_num", "text", "conf")
+        pages: list[dict] = [{column: [] for column in columns} for _ in images]
+        for row, page_num in enumerate(ocr_data.get("page_num", [])):
+            page_data = pages[int(page_num) - 1]
+            for column in columns:
+                page_data[column].append(ocr_data[column][row])
+
+        return [
+            (_text_from_ocr_data(page_data), average_confidence(page_data["conf"]))
+            for page_data in pages
+        ]
+
+    def _preprocess_image_basic(self, image: Image.Image) -> Image.Image:
+        """
+        Préprocesser l'image de manière basique (fallback).
+
+        Args:
+            image: Image PIL à préprocesser
+
+        Returns:
+            Image préprocessée
+        """
+        return preprocess_basic(image)
 
     async def extract_text_from_file(
         self, file_path: str, lang: str = "fra+eng"
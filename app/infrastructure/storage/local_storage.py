@@ -1,6 +1,7 @@
 """Stockage local de fichiers."""
 
-import aiofiles
+import asyncio
+import os
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +12,47 @@ from app.core.logging import get_logger
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Taille (octets) en dessous de laquelle un fichier est lu directement : la lecture
+# coûte moins que le passage par un thread
+SMALL_FILE_READ_SIZE = 64 * 1024
+
+# Ouverture en écriture : création ou troncature, sans traduction des fins de ligne
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def _write_file(file_path: Path, file_content: bytes) -> None:
+    """
+    Écrire un fichier directement par descripteur.
+
+    Évite la couche io.open (fstat de détection du tampon, objet fichier bufferisé) :
+    un open, le(s) write et un close.
+    """
+    fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(file_content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _read_file(fd: int, size: int) -> bytes:
+    """
+    Lire un fichier ouvert dont la taille est déjà connue (fstat), puis le fermer.
+
+    Le contenu est lu en un seul os.read dans un tampon alloué à la bonne taille,
+    sans agrandissements ni copie ; la suite éventuelle (fichier modifié depuis
+    le fstat) est lue jusqu'à la fin.
+    """
+    try:
+        chunks = [os.read(fd, size)] if size else []
+        while chunk := os.read(fd, SMALL_FILE_READ_SIZE):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
 
 class LocalStorage:
     """Stockage local de fichiers."""
@@ -34,8 +76,7 @@ class LocalStorage:
         file_path = self.base_dir / filename
 
         try:
-            async with aiofiles.open(file_path, "wb") as f:
-                await f.write(file_content)
+            await asyncio.to_thread(_write_file, file_path, file_content)
             logger.info(f"Fichier sauvegardé: {file_path}")
             return file_path
         except Exception as e:
@@ -53,13 +94,26 @@ class LocalStorage:
             Contenu du fichier
         """
         path = Path(file_path)
-        if not path.exists():
+        # Ouvrir directement (pas de stat préalable sur le chemin) : la taille est
+        # ensuite lue sur le descripteur
+        try:
+            fd = os.open(path, _READ_FLAGS)
+        except FileNotFoundError:
             raise StorageError(f"Fichier non trouvé: {path}")
+        except Exception as e:
+            logger.exception(f"Erreur lors de la lecture: {e}")
+            raise StorageError(f"Impossible de lire le fichier: {str(e)}")
 
         try:
-            async with aiofiles.open(path, "rb") as f:
-                content = await f.read()
-            return content
+            try:
+                size = os.fstat(fd).st_size
+            except BaseException:
+                os.close(fd)
+                raise
+            # _read_file ferme le descripteur
+            if size <= SMALL_FILE_READ_SIZE:
+                return _read_file(fd, size)
+            return await asyncio.to_thread(_read_file, fd, size)
         except Exception as e:
             logger.exception(f"Erreur lors de la lecture: {e}")
             raise StorageError(f"Impossible de lire le fichier: {str(e)}")
@@ -72,11 +126,12 @@ class LocalStorage:
             file_path: Chemin vers le fichier
         """
         path = Path(file_path)
-        if path.exists():
-            try:
-                path.unlink()
-                logger.info(f"Fichier supprimé: {path}")
-            except Exception as e:
-                logger.exception(f"Erreur lors de la suppression: {e}")
-                raise StorageError(f"Impossible de supprimer le fichier: {str(e)}")
-
+        try:
+            path.unlink()
+            logger.info(f"Fichier supprimé: {path}")
+        except FileNotFoundError:
+            # Fichier déjà absent : rien à supprimer
+            return
+        except Exception as e:
+            logger.exception(f"Erreur lors de la suppression: {e}")
+            raise StorageError(f"Impossible de supprimer le fichier: {str(e)}")
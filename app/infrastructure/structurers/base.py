@@ -12,7 +12,7 @@ class BaseStructurer(ABC):
         self.logger = logger
 
     @abstractmethod
-    async def structure(self, *args: Any, **kwargs: Any) -> Any:
+    def structure(self, *args: Any, **kwargs: Any) -> Any:
         """Structurer les données."""
         pass
 
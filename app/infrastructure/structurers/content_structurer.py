@@ -1,6 +1,7 @@
 """Structurateur de contenu."""
 
-from uuid import UUID, uuid4
+import os
+from uuid import UUID
 from typing import Any
 
 from app.core.logging import get_logger
@@ -9,6 +10,15 @@ from app.domain.value_objects.extraction_result import ExtractionResult
 from app.infrastructure.structurers.base import BaseStructurer
 
 
+def _new_uuids(count: int) -> list[UUID]:
+    """Générer ``count`` UUID4 à partir d'un seul appel à os.urandom."""
+    random_bytes = os.urandom(16 * count)
+    return [
+        UUID(bytes=random_bytes[offset : offset + 16], version=4)
+        for offset in range(0, 16 * count, 16)
+    ]
+
+
 class ContentStructurer(BaseStructurer):
     """Structurateur de contenu pour organiser les blocs par type."""
 
@@ -16,7 +26,7 @@ class ContentStructurer(BaseStructurer):
         """Initialiser le structurateur."""
         super().__init__(logger or get_logger(__name__))
 
-    async def structure(
+    def structure(
         self, extraction_result: ExtractionResult, document_id: UUID | str
     ) -> list[ContentBlock]:
         """
@@ -29,25 +39,15 @@ class ContentStructurer(BaseStructurer):
         Returns:
             Liste de blocs de contenu structurés
         """
-        content_blocks: list[ContentBlock] = []
-
-        # Structurer les blocs de texte
-        text_blocks = await self._structure_text_blocks(
-            extraction_result.text_blocks, document_id
-        )
-        content_blocks.extend(text_blocks)
+        # Convertir document_id en UUID une seule fois pour tous les blocs
+        doc_id_uuid = UUID(document_id) if isinstance(document_id, str) else document_id
 
-        # Structurer les tableaux
-        table_blocks = await self._structure_table_blocks(
-            extraction_result.tables, document_id
-        )
-        content_blocks.extend(table_blocks)
-
-        # Structurer les images
-        image_blocks = await self._structure_image_blocks(
-            extraction_result.images, document_id
-        )
-        content_blocks.extend(image_blocks)
+        # Construction purement CPU : appels synchrones, sans coroutine par type
+        content_blocks: list[ContentBlock] = [
+            *self._structure_text_blocks(extraction_result.text_blocks, doc_id_uuid),
+            *self._structure_table_blocks(extraction_result.tables, doc_id_uuid),
+            *self._structure_image_blocks(extraction_result.images, doc_id_uuid),
+        ]
 
         # Établir les relations entre blocs
         content_blocks = self._establish_relations(content_blocks)
@@ -55,51 +55,36 @@ class ContentStructurer(BaseStructurer):
         self.logger.info(f"Structuration terminée: {len(content_blocks)} blocs créés")
         return content_blocks
 
-    async def _structure_text_blocks(
-        self, text_blocks: list, document_id: UUID | str
+    def _structure_text_blocks(
+        self, text_blocks: list, doc_id_uuid: UUID
     ) -> list[ContentBlock]:
         """Structurer les blocs de texte."""
-        content_blocks: list[ContentBlock] = []
-
-        for text_block in text_blocks:
-            # Déterminer le type de contenu
-            content_type = ContentType.TEXT
-            if text_block.metadata.section_level:
-                if text_block.metadata.section_level <= 3:
-                    content_type = ContentType.HEADING
-
-            # Extraire les entités
-            entities = text_block.metadata.additional_metadata.get("entities", [])
-
-            # Convertir document_id en UUID si c'est une string
-            doc_id_uuid = UUID(document_id) if isinstance(document_id, str) else document_id
-
-            content_block = ContentBlock(
-                id=uuid4(),
+        return [
+            ContentBlock(
+                id=block_id,
                 document_id=doc_id_uuid,
-                content_type=content_type,
+                # Les niveaux de section 1 à 3 sont des titres
+                content_type=(
+                    ContentType.HEADING
+                    if text_block.metadata.section_level
+                    and text_block.metadata.section_level <= 3
+                    else ContentType.TEXT
+                ),
                 content={"text": text_block.content},
                 metadata=text_block.metadata,
-                entities=entities,
+                entities=text_block.metadata.additional_metadata.get("entities", []),
                 relevance_score=text_block.metadata.confidence,
             )
+            for block_id, text_block in zip(_new_uuids(len(text_blocks)), text_blocks)
+        ]
 
-            content_blocks.append(content_block)
-
-        return content_blocks
-
-    async def _structure_table_blocks(
-        self, table_blocks: list, document_id: UUID | str
+    def _structure_table_blocks(
+        self, table_blocks: list, doc_id_uuid: UUID
     ) -> list[ContentBlock]:
         """Structurer les blocs de tableaux."""
-        content_blocks: list[ContentBlock] = []
-
-        for table_block in table_blocks:
-            # Convertir document_id en UUID si c'est une string
-            doc_id_uuid = UUID(document_id) if isinstance(document_id, str) else document_id
-            
-            content_block = ContentBlock(
-                id=uuid4(),
+        return [
+            ContentBlock(
+                id=block_id,
                 document_id=doc_id_uuid,
                 content_type=ContentType.TABLE,
                 content={
@@ -110,22 +95,16 @@ class ContentStructurer(BaseStructurer):
                 },
                 metadata=table_block.metadata,
             )
+            for block_id, table_block in zip(_new_uuids(len(table_blocks)), table_blocks)
+        ]
 
-            content_blocks.append(content_block)
-
-        return content_blocks
-
-    async def _structure_image_blocks(
-        self, image_blocks: list, document_id: UUID | str
+    def _structure_image_blocks(
+        self, image_blocks: list, doc_id_uuid: UUID
     ) -> list[ContentBlock]:
         """Structurer les blocs d'images."""
-        content_blocks: list[ContentBlock] = []
-
-        for image_block in image_blocks:
-            # Convertir document_id en UUID si c'est une string
-            doc_id_uuid = UUID(document_id) if isinstance(document_id, str) else document_id
-            content_block = ContentBlock(
-                id=uuid4(),
+        return [
+            ContentBlock(
+                id=block_id,
                 document_id=doc_id_uuid,
                 content_type=ContentType.IMAGE,
                 content={
@@ -135,10 +114,8 @@ class ContentStructurer(BaseStructurer):
                 },
                 metadata=image_block.metadata,
             )
-
-            content_blocks.append(content_block)
-
-        return content_blocks
+            for block_id, image_block in zip(_new_uuids(len(image_blocks)), image_blocks)
+        ]
 
     def _establish_relations(
         self, content_blocks: list[ContentBlock]
@@ -149,23 +126,27 @@ class ContentStructurer(BaseStructurer):
             content_blocks, key=lambda b: (b.metadata.order, b.metadata.page_number or 0)
         )
 
-        # Établir les relations précédent/suivant
-        for i, block in enumerate(sorted_blocks):
-            if i > 0:
-                block.previous_block_id = sorted_blocks[i - 1].id
-            if i < len(sorted_blocks) - 1:
-                block.next_block_id = sorted_blocks[i + 1].id
-
-            # Établir les relations parent (basées sur les sections)
-            if block.metadata.section_id:
-                # Trouver le bloc parent (section)
-                for parent_block in sorted_blocks:
-                    if (
-                        parent_block.content_type == ContentType.HEADING
-                        and parent_block.metadata.section_title == block.metadata.section_title
-                    ):
+        # Premier titre de chaque section, dans l'ordre des blocs
+        heading_by_title: dict = {}
+        for block in sorted_blocks:
+            if block.content_type == ContentType.HEADING:
+                heading_by_title.setdefault(block.metadata.section_title, block)
+
+        # Établir les relations précédent/suivant (IDs lus une seule fois, sans
+        # arithmétique d'indices dans la boucle)
+        block_ids = [block.id for block in sorted_blocks]
+        for block, previous_id in zip(sorted_blocks[1:], block_ids):
+            block.previous_block_id = previous_id
+        for block, next_id in zip(sorted_blocks, block_ids[1:]):
+            block.next_block_id = next_id
+
+        # Établir les relations parent (basées sur les sections)
+        if heading_by_title:
+            for block in sorted_blocks:
+                if block.metadata.section_id:
+                    parent_block = heading_by_title.get(block.metadata.section_title)
+                    if parent_block is not None:
                         block.parent_block_id = parent_block.id
-                        break
 
         return sorted_blocks
 
@@ -1,5 +1,6 @@
 """Structurateur de document complet."""
 
+from collections import defaultdict
 from uuid import UUID
 from typing import Any
 
@@ -16,7 +17,7 @@ class DocumentStructurer(BaseStructurer):
         """Initialiser le structurateur."""
         super().__init__(logger or get_logger(__name__))
 
-    async def structure(
+    def structure(
         self, content_blocks: list[ContentBlock], document_id: UUID | str, metadata: dict[str, Any]
     ) -> StructuredData:
         """
@@ -30,27 +31,28 @@ class DocumentStructurer(BaseStructurer):
         Returns:
             Données structurées du document
         """
-        # Organiser hiérarchiquement
-        structure = self._organize_hierarchically(content_blocks)
+        # Hiérarchie, index, blocs sérialisés et statistiques en un seul passage
+        structure, index, block_dicts, statistics = self._build_all(content_blocks)
 
-        # Créer l'index pour recherche rapide
-        index = self._create_index(content_blocks)
+        # Normaliser document_id une seule fois (UUID pour l'entité, str pour le dict)
+        if isinstance(document_id, UUID):
+            doc_id_uuid = document_id
+            doc_id_str = str(document_id)
+        else:
+            doc_id_uuid = UUID(document_id)
+            doc_id_str = document_id
 
-        # Convertir document_id en string si nécessaire
-        doc_id_str = str(document_id) if isinstance(document_id, UUID) else document_id
-        
         # Construire le document structuré
         structured_data = {
             "document_id": doc_id_str,
             "metadata": metadata,
             "structure": structure,
-            "content_blocks": [self._block_to_dict(block) for block in content_blocks],
+            "content_blocks": block_dicts,
             "index": index,
-            "statistics": self._calculate_statistics(content_blocks),
+            "statistics": statistics,
         }
 
-        # Créer l'entité StructuredData (convertir string en UUID si nécessaire)
-        doc_id_uuid = UUID(doc_id_str) if isinstance(doc_id_str, str) else doc_id_str
+        # Créer l'entité StructuredData
         structured = StructuredData(
             document_id=doc_id_uuid,
             data=structured_data,
@@ -59,121 +61,94 @@ class DocumentStructurer(BaseStructurer):
         self.logger.info(f"Document structuré: {len(content_blocks)} blocs organisés")
         return structured
 
-    def _organize_hierarchically(
+    def _build_all(
         self, content_blocks: list[ContentBlock]
-    ) -> dict[str, Any]:
-        """Organiser les blocs de manière hiérarchique."""
-        structure = {"sections": []}
+    ) -> tuple[dict[str, Any], dict[str, Any], list[dict[str, Any]], dict[str, Any]]:
+        """
+        Construire toutes les sorties du document en un seul parcours des blocs.
+
+        Args:
+            content_blocks: Blocs de contenu structurés
 
+        Returns:
+            Tuple (structure hiérarchique, index de recherche, blocs sérialisés,
+            statistiques)
+        """
+        sections: list[dict[str, Any]] = []
+        structure: dict[str, Any] = {"sections": sections}
         current_section: dict[str, Any] | None = None
-        current_level = 0
+
+        by_type: defaultdict[str, list[str]] = defaultdict(list)
+        by_page: defaultdict[int, list[str]] = defaultdict(list)
+        by_entity: defaultdict[str, list[str]] = defaultdict(list)
+
+        block_dicts: list[dict[str, Any]] = []
+        total_entities = 0
 
         for block in content_blocks:
-            # Nouvelle section si c'est un titre
-            if block.content_type.value == "heading":
-                # Fermer la section précédente si elle existe
-                if current_section:
-                    structure["sections"].append(current_section)
+            # Identifiant formaté une seule fois, réutilisé partout
+            block_id = str(block.id)
+            block_type = block.content_type.value
+            metadata = block.metadata
+            entities = block.entities
 
-                # Créer une nouvelle section
+            # Hiérarchie : nouvelle section si c'est un titre
+            if block_type == "heading":
                 current_section = {
-                    "id": str(block.id),
-                    "level": block.metadata.section_level or 1,
-                    "title": block.metadata.section_title or "",
+                    "id": block_id,
+                    "level": metadata.section_level or 1,
+                    "title": metadata.section_title or "",
                     "content_blocks": [],
                 }
-                current_level = block.metadata.section_level or 1
+                sections.append(current_section)
 
             # Ajouter le bloc à la section courante
             if current_section:
-                current_section["content_blocks"].append(str(block.id))
+                current_section["content_blocks"].append(block_id)
             else:
                 # Bloc sans section parente
-                if "orphan_blocks" not in structure:
-                    structure["orphan_blocks"] = []
-                structure["orphan_blocks"].append(str(block.id))
-
-        # Ajouter la dernière section
-        if current_section:
-            structure["sections"].append(current_section)
-
-        return structure
-
-    def _create_index(self, content_blocks: list[ContentBlock]) -> dict[str, Any]:
-        """Créer un index pour recherche rapide."""
-        index = {
-            "by_type": {},
-            "by_page": {},
-            "by_entity": {},
-        }
+                structure.setdefault("orphan_blocks", []).append(block_id)
 
-        for block in content_blocks:
-            # Index par type
-            block_type = block.content_type.value
-            if block_type not in index["by_type"]:
-                index["by_type"][block_type] = []
-            index["by_type"][block_type].append(str(block.id))
-
-            # Index par page
-            page = block.metadata.page_number
-            if page:
-                if page not in index["by_page"]:
-                    index["by_page"][page] = []
-                index["by_page"][page].append(str(block.id))
-
-            # Index par entité
-            for entity in block.entities:
+            # Index par type, par page et par entité
+            by_type[block_type].append(block_id)
+            if metadata.page_number:
+                by_page[metadata.page_number].append(block_id)
+            for entity in entities:
                 entity_label = entity.get("label", "")
                 if entity_label:
-                    if entity_label not in index["by_entity"]:
-                        index["by_entity"][entity_label] = []
-                    index["by_entity"][entity_label].append(str(block.id))
-
-        return index
-
-    def _block_to_dict(self, block: ContentBlock) -> dict[str, Any]:
-        """Convertir un bloc en dictionnaire."""
-        return {
-            "id": str(block.id),
-            "type": block.content_type.value,
-            "content": block.content,
-            "metadata": {
-                "page_number": block.metadata.page_number,
-                "order": block.metadata.order,
-                "section_title": block.metadata.section_title,
-                "section_level": block.metadata.section_level,
-                **block.metadata.additional_metadata,
-            },
-            "entities": block.entities,
-            "relevance_score": block.relevance_score,
+                    by_entity[entity_label].append(block_id)
+            total_entities += len(entities)
+
+            block_dicts.append(
+                {
+                    "id": block_id,
+                    "type": block_type,
+                    "content": block.content,
+                    "metadata": {
+                        "page_number": metadata.page_number,
+                        "order": metadata.order,
+                        "section_title": metadata.section_title,
+                        "section_level": metadata.section_level,
+                        **metadata.additional_metadata,
+                    },
+                    "entities": entities,
+                    "relevance_score": block.relevance_score,
+                }
+            )
+
+        # Dictionnaires simples pour la sérialisation
+        index = {
+            "by_type": dict(by_type),
+            "by_page": dict(by_page),
+            "by_entity": dict(by_entity),
         }
 
-    def _calculate_statistics(
-        self, content_blocks: list[ContentBlock]
-    ) -> dict[str, Any]:
-        """Calculer les statistiques du document."""
-        stats = {
+        # Les statistiques se déduisent de l'index (pages non nulles distinctes)
+        statistics = {
             "total_blocks": len(content_blocks),
-            "by_type": {},
-            "total_entities": 0,
-            "total_pages": 0,
+            "by_type": {block_type: len(ids) for block_type, ids in by_type.items()},
+            "total_entities": total_entities,
+            "total_pages": len(by_page),
         }
 
-        pages = set()
-
-        for block in content_blocks:
-            # Compter par type
-            block_type = block.content_type.value
-            stats["by_type"][block_type] = stats["by_type"].get(block_type, 0) + 1
-
-            # Compter les entités
-            stats["total_entities"] += len(block.entities)
-
-            # Compter les pages
-            if block.metadata.page_number:
-                pages.add(block.metadata.page_number)
-
-        stats["total_pages"] = len(pages)
-
-        return stats
-
+        return structure, index, block_dicts, statistics
@@ -1,5 +1,6 @@
 """Structurateur de tableaux."""
 
+from itertools import zip_longest
 from typing import Any
 
 from app.core.logging import get_logger
@@ -14,7 +15,7 @@ class TableStructurer(BaseStructurer):
         """Initialiser le structurateur."""
         super().__init__(logger or get_logger(__name__))
 
-    async def structure(self, table_block: TableBlock) -> dict[str, Any]:
+    def structure(self, table_block: TableBlock) -> dict[str, Any]:
         """
         Structurer un tableau en format JSON.
 
@@ -68,35 +69,50 @@ class TableStructurer(BaseStructurer):
         self, rows: list[list[Any]], schema: dict[str, Any]
     ) -> list[dict[str, Any]]:
         """Structurer les lignes en dictionnaires."""
-        structured_rows = []
+        col_names = [col["name"] for col in schema["columns"]]
+        column_count = len(col_names)
 
-        for row in rows:
-            row_dict = {}
-            for i, col in enumerate(schema["columns"]):
-                col_name = col["name"]
-                if i < len(row):
-                    row_dict[col_name] = row[i]
-                else:
-                    row_dict[col_name] = None
-
-            structured_rows.append(row_dict)
+        # Les colonnes absentes d'une ligne trop courte valent None
+        structured_rows = [
+            dict(zip(col_names, row))
+            if len(row) >= column_count
+            else dict(zip_longest(col_names, row))
+            for row in rows
+        ]
 
         return structured_rows
 
     def to_csv_format(self, table_block: TableBlock) -> str:
         """Convertir un tableau en format CSV-ready."""
+        # Chemin rapide : sans virgule, guillemet ni saut de ligne dans les cellules,
+        # aucune cellule n'est à quoter et un simple join suffit
+        lines = []
+        for row in (table_block.headers, *table_block.rows):
+            cells = ["" if cell is None else str(cell) for cell in row]
+            line = ",".join(cells)
+            if (
+                '"' in line
+                or "\n" in line
+                or "\r" in line
+                or line.count(",") != max(len(cells) - 1, 0)
+                # Une ligne réduite à une cellule vide est écrite '""' par csv
+                or cells == [""]
+            ):
+                return self._to_csv_quoted(table_block)
+            lines.append(line)
+
+        return "".join(line + "\r\n" for line in lines)
+
+    def _to_csv_quoted(self, table_block: TableBlock) -> str:
+        """Convertir un tableau en CSV avec le module csv (cellules à quoter)."""
         import csv
         from io import StringIO
 
         output = StringIO()
         writer = csv.writer(output)
 
-        # Écrire les en-têtes
+        # Écrire les en-têtes puis les lignes
         writer.writerow(table_block.headers)
-
-        # Écrire les lignes
-        for row in table_block.rows:
-            writer.writerow(row)
+        writer.writerows(table_block.rows)
 
         return output.getvalue()
-
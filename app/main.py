@@ -1,5 +1,6 @@
 """Application FastAPI principale."""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -10,26 +11,64 @@ from app.api.middleware.request_logging import RequestLoggingMiddleware
 from app.api.v1.router import api_router
 from app.config import get_settings
 from app.core.logging import get_logger
-from app.infrastructure.database.connection import close_db, init_db
+from app.infrastructure.database.connection import close_db, init_db, warm_up_pool
+from app.infrastructure.processors.text_enricher import TextEnricher
+from app.infrastructure.services.ocr_service import OcrService
 
 settings = get_settings()
 logger = get_logger(__name__)
 
 
+async def _prepare_dependencies() -> None:
+    """Vérifier/installer les dépendances puis précharger les modèles qui en dépendent."""
+    # En production les dépendances sont supposées installées : ni vérification
+    # ni import du vérificateur (pip, sous-processus)
+    if settings.verify_deps_on_startup:
+        from app.core.dependencies_checker import check_dependencies_on_startup
+
+        # La vérification est bloquante (import/chargement SpaCy, sous-processus) :
+        # l'exécuter dans un thread laisse la boucle libre pour init_db
+        dependencies_ok = await asyncio.to_thread(
+            asyncio.run, check_dependencies_on_startup()
+        )
+        if not dependencies_ok:
+            logger.warning(
+                "Certaines dépendances sont manquantes, mais l'application continue..."
+            )
+
+    # Précharger le modèle SpaCy pour éviter le démarrage à froid de la première requête
+    if not settings.nlp_lazy_mode:
+        try:
+            await asyncio.to_thread(
+                TextEnricher.preload, settings.spacy_model, use_gpu=settings.spacy_use_gpu
+            )
+            logger.info("Modèle SpaCy préchargé")
+        except Exception as e:
+            logger.warning(f"Impossible de précharger le modèle SpaCy: {e}")
+
+    # Préchauffer Tesseract (lecture des modèles de langue) si demandé
+    if settings.tesseract_warm_up:
+        ocr_service = OcrService(tesseract_cmd=settings.tesseract_cmd, warm_up_on_init=True)
+        await ocr_service.is_available()
+
+
+async def _init_database() -> None:
+    """Initialiser la base de données."""
+    await init_db()
+    await warm_up_pool()
+    logger.info("Base de données initialisée")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Gérer le cycle de vie de l'application."""
     # Startup
     logger.info("Démarrage de l'application...")
-    
-    # Vérifier et installer les dépendances
-    from app.core.dependencies_checker import check_dependencies_on_startup
-    dependencies_ok = await check_dependencies_on_startup()
-    if not dependencies_ok:
-        logger.warning("Certaines dépendances sont manquantes, mais l'application continue...")
-    
-    await init_db()
-    logger.info("Base de données initialisée")
+
+    # Dépendances (et modèles) et base de données sont indépendantes : en parallèle
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(_init_database())
+        tg.create_task(_prepare_dependencies())
 
     yield
 
@@ -19,8 +19,37 @@ class AsyncProcessingQueue:
     def __init__(self, max_concurrent: int = 4) -> None:
         """Initialiser la queue."""
         self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
-        self.tasks: dict[UUID, asyncio.Task] = {}
+        # Canal borné : au plus max_concurrent * 4 documents en attente
+        self.queue: asyncio.Queue[tuple[asyncio.Future, tuple[Any, ...]]] = asyncio.Queue(
+            maxsize=max_concurrent * 4
+        )
+        self.futures: dict[UUID, asyncio.Future] = {}
+        # Workers persistants, démarrés au premier ajout (une boucle doit tourner)
+        self._workers: list[asyncio.Task] = []
+
+    def _ensure_workers(self) -> None:
+        """Démarrer les workers s'ils ne tournent pas encore."""
+        if self._workers and not all(worker.done() for worker in self._workers):
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"processing-worker-{i}")
+            for i in range(self.max_concurrent)
+        ]
+
+    async def _worker(self) -> None:
+        """Traiter en continu les documents lus dans la queue."""
+        while True:
+            future, args = await self.queue.get()
+            try:
+                await self.process_document(*args)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(None)
+            finally:
+                self.queue.task_done()
 
     async def process_document(
         self,
@@ -44,42 +73,39 @@ class AsyncProcessingQueue:
             content_repo: Repository pour contenu
             progress_callback: Callback pour suivre la progression
         """
-        async with self.semaphore:
+        # Mettre à jour le statut pendant que le traitement démarre ; l'écriture est
+        # attendue avant tout autre changement de statut
+        status_update = asyncio.create_task(
+            document_repo.update_status([document_id], "extracting")
+        )
+        try:
+            # Callback de progression interne
+            def internal_callback(message: str, progress: float) -> None:
+                if progress_callback:
+                    progress_callback(document_id, message, progress)
+
+            # Traiter le document
             try:
-                # Mettre à jour le statut
-                document_model = await document_repo.get_by_id(document_id)
-                if document_model:
-                    document_model.status = "extracting"
-                    await document_repo.update(document_model)
-
-                # Callback de progression interne
-                def internal_callback(message: str, progress: float) -> None:
-                    if progress_callback:
-                        progress_callback(document_id, message, progress)
-
-                # Traiter le document
                 structured_data = await pipeline.process(
                     file_path, document, internal_callback
                 )
+            finally:
+                await status_update
 
-                # Sauvegarder les résultats (simplifié)
-                # TODO: Sauvegarder les content blocks et structured data
+            # Sauvegarder les résultats (simplifié)
+            # TODO: Sauvegarder les content blocks et structured data
 
-                # Mettre à jour le statut
-                if document_model:
-                    document_model.status = "completed"
-                    await document_repo.update(document_model)
+            # Mettre à jour le statut
+            await document_repo.update_status([document_id], "completed")
 
-                logger.info(f"Traitement terminé pour document {document_id}")
+            logger.info(f"Traitement terminé pour document {document_id}")
 
-            except Exception as e:
-                logger.exception(f"Erreur lors du traitement du document {document_id}: {e}")
-                # Mettre à jour le statut en erreur
-                document_model = await document_repo.get_by_id(document_id)
-                if document_model:
-                    document_model.status = "failed"
-                    document_model.error_message = str(e)
-                    await document_repo.update(document_model)
+        except Exception as e:
+            logger.exception(f"Erreur lors du traitement du document {document_id}: {e}")
+            # Mettre à jour le statut en erreur
+            await document_repo.update_status(
+                [document_id], "failed", error_message=str(e)
+            )
 
     def add_task(
         self,
@@ -90,29 +116,41 @@ class AsyncProcessingQueue:
         document_repo: DocumentRepository,
         content_repo: ContentRepository,
         progress_callback: Callable[[UUID, str, float], None] | None = None,
-    ) -> asyncio.Task:
-        """Ajouter une tâche de traitement à la queue."""
-        task = asyncio.create_task(
-            self.process_document(
-                document_id,
-                file_path,
-                document,
-                pipeline,
-                document_repo,
-                content_repo,
-                progress_callback,
+    ) -> asyncio.Future:
+        """
+        Ajouter une tâche de traitement à la queue.
+
+        Returns:
+            Future résolue lorsque le document a été traité
+
+        Raises:
+            asyncio.QueueFull: Si la queue a atteint sa capacité maximale
+        """
+        self._ensure_workers()
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait(
+            (
+                future,
+                (
+                    document_id,
+                    file_path,
+                    document,
+                    pipeline,
+                    document_repo,
+                    content_repo,
+                    progress_callback,
+                ),
             )
         )
-        self.tasks[document_id] = task
-        return task
+        self.futures[document_id] = future
+        return future
 
     async def wait_for_task(self, document_id: UUID) -> None:
         """Attendre qu'une tâche soit terminée."""
-        if document_id in self.tasks:
-            await self.tasks[document_id]
-            del self.tasks[document_id]
+        if document_id in self.futures:
+            await self.futures[document_id]
+            del self.futures[document_id]
 
 
 # Instance globale de la queue
 processing_queue = AsyncProcessingQueue(max_concurrent=4)
-
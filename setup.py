@@ -26,7 +26,6 @@ setup(
         "alembic>=1.12.1",
         "asyncpg>=0.29.0",
         "aiosqlite>=0.19.0",
-        "aiofiles>=23.2.1",
         "python-dotenv>=1.0.0",
         "pythonjsonlogger>=2.0.7",
     ],
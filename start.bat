@@ -18,6 +18,10 @@ if errorlevel 1 (
 echo Installation/Verification des dependances...
 python install_dependencies.py
 
+REM Les processus Tesseract tournent en parallele : un seul thread OpenMP chacun
+REM (sauf valeur deja definie)
+if not defined OMP_THREAD_LIMIT set OMP_THREAD_LIMIT=1
+
 echo.
 echo Demarrage du serveur...
 echo.
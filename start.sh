@@ -16,6 +16,10 @@ fi
 echo "Installation/Vérification des dépendances..."
 python3 install_dependencies.py
 
+# Les processus Tesseract tournent en parallèle : un seul thread OpenMP chacun
+# (sauf valeur déjà définie)
+export OMP_THREAD_LIMIT="${OMP_THREAD_LIMIT:-1}"
+
 echo ""
 echo "Démarrage du serveur..."
 echo ""
@@ -1,35 +1,336 @@
 """Script de test pour vérifier le démarrage de l'application."""
 
-import asyncio
+import argparse
+import hashlib
+import importlib
+import importlib.util
+import os
 import sys
+import tempfile
+import time
+import traceback
+from typing import Any
+
+# Attributs déjà importés, par (module, attribut)
+_IMPORT_CACHE: dict[tuple[str, str], Any] = {}
+
+# Modules importés par le test : leur présence est vérifiée avant tout import
+_STARTUP_MODULES = (
+    "app.core.dependencies_checker",
+    "app.infrastructure.database.connection",
+    "app.main",
+)
+
+# Profilage par points de contrôle (STARTUP_PROFILE=1), sans coût sinon
+_STARTUP_PROFILE = bool(os.environ.get("STARTUP_PROFILE"))
+_last_checkpoint = time.perf_counter()
+
+
+def _checkpoint(label: str) -> None:
+    """Afficher le temps écoulé depuis le point de contrôle précédent."""
+    global _last_checkpoint
+    if not _STARTUP_PROFILE:
+        return
+    now = time.perf_counter()
+    print(f"[{now - _last_checkpoint:.3f}s] {label}")
+    _last_checkpoint = now
+
+
+def _check_modules_present(module_paths) -> None:
+    """
+    Vérifier que les modules existent sans les exécuter (find_spec).
+
+    Raises:
+        ImportError: Si un module est introuvable
+    """
+    for module_path in module_paths:
+        if importlib.util.find_spec(module_path) is None:
+            raise ImportError(f"Module introuvable: {module_path}")
+
+
+def cached_import(module_path: str, attribute: str) -> Any:
+    """
+    Importer un attribut d'un module en le gardant en cache.
+
+    Le module est pris dans sys.modules s'il est déjà chargé.
+
+    Args:
+        module_path: Chemin du module (ex. "app.main")
+        attribute: Nom de l'attribut à récupérer
+
+    Returns:
+        Attribut importé
+    """
+    key = (module_path, attribute)
+    value = _IMPORT_CACHE.get(key)
+    if value is None:
+        module = sys.modules.get(module_path) or importlib.import_module(module_path)
+        value = _IMPORT_CACHE[key] = getattr(module, attribute)
+    return value
+
+
+# Délais maximaux (secondes) des étapes, pour échouer au lieu de bloquer
+DEP_TIMEOUT = float(os.environ.get("DEP_TIMEOUT", "10"))
+DB_TIMEOUT = float(os.environ.get("DB_TIMEOUT", "10"))
+
+
+# Une vérification des dépendances réussie reste valable DEPS_CACHE_TTL secondes
+# tant que Python et les paquets installés ne changent pas
+DEPS_CACHE_TTL = 300
+
+
+class StepTimeoutError(Exception):
+    """Étape du démarrage qui a dépassé son délai."""
+
+
+async def _timed(awaitable, label: str, timeout: float | None = None) -> None:
+    """
+    Attendre une étape du démarrage et afficher son succès.
+
+    Raises:
+        StepTimeoutError: Si l'étape dépasse timeout secondes
+    """
+    import asyncio
+
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(awaitable, timeout)
+    except TimeoutError as e:
+        raise StepTimeoutError(f"{label} : delai de {timeout:g}s depasse") from e
+    _checkpoint(label)
+    print(f"[OK] {label} ({time.perf_counter() - start:.2f}s)")
+
+
+def _deps_cache_path() -> str:
+    """
+    Chemin du fichier témoin d'une vérification des dépendances réussie.
+
+    Le nom dépend de l'interpréteur et de la date de modification des répertoires
+    de sys.path (modifiés à chaque installation/désinstallation de paquet).
+    """
+    fingerprint = "|".join(
+        [
+            sys.version,
+            sys.executable,
+            *(f"{path}:{os.stat(path).st_mtime_ns}" for path in sys.path if os.path.isdir(path)),
+        ]
+    )
+    digest = hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()
+    return os.path.join(tempfile.gettempdir(), f"startup_ok_{digest}")
+
+
+def _check_dependencies(check_dependencies_on_startup) -> bool:
+    """
+    Vérifier les dépendances, sauf si une vérification récente a réussi.
+
+    Bloquant : la vérification tourne sur sa propre boucle d'événements.
+
+    Returns:
+        True si les dépendances sont présentes
+    """
+    import asyncio
+
+    cache_path = _deps_cache_path()
+    try:
+        if time.time() - os.stat(cache_path).st_mtime < DEPS_CACHE_TTL:
+            print("Dependances deja verifiees (cache)")
+            return True
+    except FileNotFoundError:
+        pass
+
+    dependencies_ok = asyncio.run(check_dependencies_on_startup())
+    if dependencies_ok:
+        with open(cache_path, "a"):
+            os.utime(cache_path)
+    return dependencies_ok
+
+
+def _database_address() -> tuple[str, int | None] | None:
+    """
+    Hôte et port du serveur de base de données configuré.
+
+    Returns:
+        (hôte, port), ou None sans serveur réseau (SQLite, socket Unix)
+    """
+    from sqlalchemy.engine import make_url
+
+    get_settings = cached_import("app.config", "get_settings")
+    url = make_url(get_settings().database_url)
+    if not url.host:
+        return None
+    return url.host, url.port
+
+
+async def _init_database(init_db, warm_up_pool, dns_lookup=None) -> None:
+    """
+    Initialiser la base de données puis pré-remplir le pool de connexions.
+
+    Args:
+        init_db: Fonction d'initialisation de la base
+        warm_up_pool: Fonction de préchauffage du pool
+        dns_lookup: Résolution DNS de l'hôte de la base, lancée au début du test
+    """
+    if dns_lookup is not None:
+        await dns_lookup
+    await init_db()
+    await warm_up_pool()
+
 
 async def test_startup():
     """Tester le démarrage de l'application."""
+    import asyncio
+
     try:
-        print("Import de l'application...")
-        from app.main import app
-        print("[OK] Application importee avec succes")
-        
-        print("\nVerification des dependances...")
-        from app.core.dependencies_checker import check_dependencies_on_startup
-        await check_dependencies_on_startup()
-        print("[OK] Dependances verifiees")
-        
-        print("\nTest de la connexion a la base de donnees...")
-        from app.infrastructure.database.connection import init_db
-        await init_db()
-        print("[OK] Base de donnees initialisee")
-        
+        # Modules légers d'abord : une dépendance manquante échoue avant l'import
+        # (coûteux) de toute l'application
+        _checkpoint("debut du test")
+        _check_modules_present(_STARTUP_MODULES)
+        check_dependencies_on_startup = cached_import(
+            "app.core.dependencies_checker", "check_dependencies_on_startup"
+        )
+        init_db = cached_import("app.infrastructure.database.connection", "init_db")
+        warm_up_pool = cached_import("app.infrastructure.database.connection", "warm_up_pool")
+        _checkpoint("import des modules de demarrage")
+        print("[OK] Modules de demarrage importes")
+
+        # Résoudre l'hôte de la base dès maintenant : la requête DNS avance pendant
+        # la vérification des dépendances, et un hôte inconnu échoue tôt
+        address = _database_address()
+        dns_lookup = (
+            asyncio.create_task(asyncio.get_running_loop().getaddrinfo(*address))
+            if address is not None
+            else None
+        )
+
+        # Étapes du démarrage : les étapes d'un même groupe sont indépendantes et
+        # tournent en parallèle, les groupes s'enchaînent. Les opérations bloquantes
+        # (vérification des dépendances, import de l'application) tournent dans un
+        # thread.
+        stages = [
+            [
+                (
+                    "Verification des dependances",
+                    lambda: asyncio.to_thread(
+                        _check_dependencies, check_dependencies_on_startup
+                    ),
+                    DEP_TIMEOUT,
+                ),
+                (
+                    "Initialisation de la base de donnees",
+                    lambda: _init_database(init_db, warm_up_pool, dns_lookup),
+                    DB_TIMEOUT,
+                ),
+            ],
+            [
+                (
+                    "Import de l'application",
+                    lambda: asyncio.to_thread(cached_import, "app.main", "app"),
+                    None,
+                ),
+            ],
+        ]
+        for stage in stages:
+            print()
+            results = await asyncio.gather(
+                *(_timed(factory(), label, timeout) for label, factory, timeout in stage),
+                return_exceptions=True,
+            )
+            # Une écriture par groupe d'étapes (sortie non bufferisée par ligne)
+            sys.stdout.flush()
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
         print("\n[OK] Tous les tests sont passes !")
         print("\nVous pouvez maintenant démarrer l'application avec :")
         print("  uvicorn app.main:app --reload")
-        
+
+    except StepTimeoutError as e:
+        print(f"\n[TIMEOUT] {e}")
+        _abort(2)
+
     except Exception as e:
         print(f"\n[ERREUR] {e}")
-        import traceback
+        sys.stdout.flush()
         traceback.print_exc()
-        sys.exit(1)
+        _abort(1)
 
-if __name__ == "__main__":
-    asyncio.run(test_startup())
 
+def _abort(code: int) -> None:
+    """
+    Quitter immédiatement après un échec du démarrage.
+
+    os._exit saute volontairement les handlers atexit, le ramasse-miettes et
+    l'attente des threads : le processus est en échec, une vérification bloquée
+    dans son thread ne peut pas être annulée, et les connexions ouvertes sont
+    fermées par le système.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
+
+def main() -> None:
+    """
+    Lancer le test de démarrage.
+
+    TEST_STARTUP_BATCH=N enchaîne N exécutions sur une même boucle d'événements
+    (uvloop si installé) au lieu d'en recréer une à chaque fois.
+    """
+    global _STARTUP_PROFILE
+
+    parser = argparse.ArgumentParser(description="Tester le démarrage de l'application.")
+    parser.add_argument(
+        "--precompile",
+        action="store_true",
+        help="générer seulement le bytecode de app/ (une fois en CI, avant les "
+        "exécutions chronométrées)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="afficher la durée de chaque étape (équivaut à STARTUP_PROFILE=1)",
+    )
+    args = parser.parse_args()
+
+    if args.profile:
+        _STARTUP_PROFILE = True
+
+    # --precompile : générer le bytecode de app/ (étape de build) puis quitter
+    if args.precompile:
+        import compileall
+
+        sys.dont_write_bytecode = False
+        app_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app")
+        ok = compileall.compile_dir(app_dir, quiet=1, workers=0)
+        sys.exit(0 if ok else 1)
+
+    # asyncio n'est importé qu'ici : --help et --precompile n'en paient pas le coût
+    import asyncio
+
+    runs = int(os.environ.get("TEST_STARTUP_BATCH") or 1)
+
+    # Regrouper les messages : stdout est vidé une fois par groupe d'étapes (et à
+    # la sortie) plutôt qu'à chaque ligne
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
+    try:
+        import uvloop
+    except ImportError:  # uvloop optionnel : boucle asyncio standard
+        uvloop = None
+
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        for _ in range(runs):
+            loop.run_until_complete(test_startup())
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
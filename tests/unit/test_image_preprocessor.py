@@ -0,0 +1,37 @@
+"""Tests du preprocessing d'images."""
+
+import numpy as np
+import pytest
+
+from app.infrastructure.services.image_preprocessor import (
+    SAUVOLA_K,
+    SAUVOLA_WINDOW_SIZE,
+    _sauvola_binarize,
+)
+
+filters = pytest.importorskip("skimage.filters")
+
+
+def _reference_images() -> list[np.ndarray]:
+    """Images uint8 : bruit, dégradés, uniforme et plus petite que la fenêtre."""
+    rng = np.random.default_rng(0)
+    gradient = np.tile(np.linspace(0, 255, 160), (90, 1))
+    noisy_gradient = gradient + rng.normal(0, 20, gradient.shape)
+    return [
+        rng.integers(0, 256, (120, 160), dtype=np.uint8),
+        np.clip(noisy_gradient, 0, 255).astype(np.uint8),
+        np.clip(noisy_gradient.T, 0, 255).astype(np.uint8),
+        rng.integers(100, 140, (17, 13), dtype=np.uint8),
+        np.full((40, 40), 200, dtype=np.uint8),
+    ]
+
+
+@pytest.mark.parametrize("image", _reference_images())
+def test_sauvola_binarize_matches_skimage(image: np.ndarray) -> None:
+    """Même binarisation que skimage.filters.threshold_sauvola."""
+    threshold = filters.threshold_sauvola(
+        image, window_size=SAUVOLA_WINDOW_SIZE, k=SAUVOLA_K
+    )
+    expected = np.where(image > threshold, 255, 0).astype(np.uint8)
+
+    np.testing.assert_array_equal(_sauvola_binarize(image), expected)
@@ -0,0 +1,62 @@
+"""Tests de non-régression du correcteur post-OCR."""
+
+import pytest
+
+from app.infrastructure.services.ocr_corrector import get_ocr_corrector
+
+# Corpus de référence : (texte OCR, texte corrigé attendu). Les sorties attendues
+# ont été produites par les règles d'origine (corrections appliquées passe par
+# passe), avant leur regroupement en une passe unique.
+REFERENCE_CORPUS = [
+    ("", ""),
+    ("   ", "   "),
+    ("Texte sans erreur.", "Texte sans erreur."),
+    ("cudi 2 mbre 2025", "Jeudi 2 décembre 2025"),
+    ("Cudl 2 mbre 2025 à 10h", "Jeudi 2 décembre 2025 à 10h"),
+    ("eudi 24 décembre 2025", "Jeudi 24 décembre 2025"),
+    ("Réunion le 2 mbre 2025", "Réunion le 2 décembre 2025"),
+    ("du 31 mbre 2024 au 2 mbre 2025", "du 31 décembre 2024 au 2 décembre 2025"),
+    ("Publié le 25 DÉCEMBRE 2025", "Publié le 25 décembre 2025"),
+    ("lus d'fos sur le site", "plus d'infos sur le site"),
+    ("Pour plus d'fos, voir annexe", "Pour plus d'infos, voir annexe"),
+    ("lus d'infos : contactez-nous", "plus d'infos : contactez-nous"),
+    ("PLUS D'INFOS", "plus d'infos"),
+    ("tol N° 25/001 du 12 mars", "LOI N° 25/001 du 12 mars"),
+    ("TOL N° 18/035", "LOI N° 18/035"),
+    ("ou 16 OCTOBRE 2025", "DU 16 OCTOBRE 2025"),
+    ("Fait à Kinshasa, ou 3 JANVIER 2024", "Fait à Kinshasa, DU 3 JANVIER 2024"),
+    ("ou 2 mbre 2025", "DU 2 décembre 2025"),
+    ("Pérode 1 : janvier", "Période 1 : janvier"),
+    ("B Pérode 2", "BB Période 2"),
+    ("M Période 3", "BB Période 3"),
+    ("REPUBLIQUE   DEMOCRATIQUE DU CONGO", "REPUBLIQUE DEMOCRATIQUE DU CONGO"),
+    ("republique democratique du congo", "REPUBLIQUE DEMOCRATIQUE DU CONGO"),
+    (
+        "JOURNAL OFFICIEL REPUBLIQUE DEMOCRATIQUE DU CONGO",
+        "JOURNAL OFFICIEL\nDE LA\nREPUBLIQUE DEMOCRATIQUE DU CONGO",
+    ),
+    ("Montant : 2 0 2025 francs", "Montant : 202025 francs"),
+    ("Année 2 0 2024 DÉCEMBRE 2025", "Année 202024 décembre 2025"),
+    ("Ligne 1\n\n\n\nLigne 2", "Ligne 1 Ligne 2"),
+    (
+        "  espaces   multiples  \n  en début de ligne  ",
+        "espaces multiples en début de ligne",
+    ),
+    ("Article 12\nAlinéa 3\n\nArticle 13", "Article 12 Alinéa 3 Article 13"),
+    ("d'fos\td'infos\xa0cudi", "d'infos d'infos Jeudi"),
+    ("Ouverture du 5 au 9 juin 2025", "Ouverture du 5 au 9 juin 2025"),
+    (
+        "Le 2 mbre 2025, journal officiel republique",
+        "Le 2 décembre 2025, JOURNAL OFFICIEL\nDE LA\nREPUBLIQUE",
+    ),
+    ("mbre", "décembre"),
+    ("2 mbre", "2 décembre"),
+    ("eudi, cudi et cudl", "Jeudi, Jeudi et Jeudi"),
+    ("B Période 4 et M Pérode 5", "BB Période 4 et BB Période 5"),
+]
+
+
+@pytest.mark.parametrize(("text", "expected"), REFERENCE_CORPUS)
+def test_correct_text_matches_reference(text: str, expected: str) -> None:
+    """La passe unique donne le même texte que les règles d'origine."""
+    assert get_ocr_corrector().correct_text(text) == expected